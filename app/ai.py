@@ -1,7 +1,39 @@
-import random
+import array
+import numpy as np
+from functools import lru_cache
 from typing import Literal, Dict, Any, Tuple, List, Optional
-from .player import Player
-from .hand_evaluator import HandEvaluator
+from .player import Player, Stage, ACTION_CODES, FOLD, CHECK, CALL, RAISE
+
+# Policy table code for "call a fraction of the time, otherwise fold"
+_LOOSE_CALL = -1
+
+
+@lru_cache(maxsize=None)
+def _policy_table(aggression_factor: float) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Precomputes the action for every (hand strength bucket, pot odds bucket, facing a bet) cell.
+
+    Hand strength and pot odds are both quantized to tenths; hand strength gets
+    an eleventh bucket for adjusted strengths of 1.0 and above.
+    """
+    table = []
+    for strength in range(11):
+        row = []
+        for odds in range(10):
+            favorable = strength >= odds
+            if favorable and strength >= 8:
+                # Strong hand, consider raising
+                cell = (RAISE, RAISE)
+            elif favorable:
+                # Medium or marginal hand
+                cell = (CHECK, CALL)
+            else:
+                # Unfavorable: check for free, otherwise fold unless aggressive enough to chase
+                cell = (CHECK, _LOOSE_CALL if aggression_factor > 1.0 else FOLD)
+            row.append(cell)
+        table.append(tuple(row))
+    return tuple(table)
+
 
 class AIPlayer(Player):
     """
@@ -19,10 +51,69 @@ class AIPlayer(Player):
         aggression_factor (float): Adjusts the aggressiveness of the AI.
         bluff_probability (float): The probability that the AI will bluff.
         observed_players (Dict[str, Dict[str, Any]]): Information about other players' tendencies.
+
+    Each personality is its own subclass with its constants as class attributes;
+    constructing an AIPlayer returns an instance of the matching subclass.
     """
 
+    __slots__ = ('_rng', '_u', 'observed_players', '_opponent_aggr', 'previous_actions')
+
+    # Personality constants, overridden by each personality subclass
+    personality: str = 'balanced'
+    aggression_factor: float = 1.0
+    bluff_probability: float = 0.1
+
     PERSONALITIES = ['aggressive', 'passive', 'balanced', 'loose', 'tight']
 
+    AGGRESSION_FACTORS: Dict[str, float] = {
+        'aggressive': 1.5,
+        'passive': 0.5,
+        'balanced': 1.0,
+        'loose': 1.2,
+        'tight': 0.8
+    }
+
+    BLUFF_PROBABILITIES: Dict[str, float] = {
+        'aggressive': 0.2,
+        'passive': 0.05,
+        'balanced': 0.1,
+        'loose': 0.15,
+        'tight': 0.05
+    }
+
+    # Indexed by Stage
+    STAGE_MULTIPLIERS: Tuple[float, ...] = (
+        1.0,  # pre-flop
+        1.2,  # flop
+        1.3,  # turn
+        1.4,  # river
+        1.0   # showdown
+    )
+
+    POSITION_FACTORS: Dict[str, float] = {
+        'early': 0.9,
+        'middle': 1.0,
+        'late': 1.1
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._policy = _policy_table(cls.aggression_factor)
+
+    def __new__(
+        cls,
+        *args,
+        personality: Literal['aggressive', 'passive', 'balanced', 'loose', 'tight', 'randomize'] = 'randomize',
+        **kwargs
+    ):
+        if cls is AIPlayer:
+            if personality == 'randomize':
+                personality = cls.PERSONALITIES[np.random.default_rng().integers(len(cls.PERSONALITIES))]
+            if personality not in PERSONALITY_CLASSES:
+                raise ValueError(f"Unknown AI personality: {personality}.")
+            cls = PERSONALITY_CLASSES[personality]
+        return super().__new__(cls)
+
     def __init__(
         self,
         name: str,
@@ -32,41 +123,27 @@ class AIPlayer(Player):
         **kwargs
     ):
         super().__init__(name, *args, chips, **kwargs)
-        
-        self.personality = personality
-        if self.personality == 'randomize':
-            self.personality = random.choice(self.PERSONALITIES)
-            
-        self.aggression_factor = self.set_aggression_factor()
-        self.bluff_probability = self.set_bluff_probability()
+
+        # Random draws are made in one batch per decision; see decide_action
+        self._rng = np.random.default_rng()
+        self._u: List[float] = []
+
         self.observed_players: Dict[str, Dict[str, Any]] = {}
+        # Observed aggressiveness indexed by seat in game_state['players']
+        self._opponent_aggr: np.ndarray = np.empty(0)
         self.previous_actions: List[Dict[str, Any]] = []
 
     def set_aggression_factor(self) -> float:
         """
-        Sets the aggression factor based on personality.
+        Returns the aggression factor of this personality.
         """
-        personality_factors = {
-            'aggressive': 1.5,
-            'passive': 0.5,
-            'balanced': 1.0,
-            'loose': 1.2,
-            'tight': 0.8
-        }
-        return personality_factors.get(self.personality, 1.0)
+        return self.aggression_factor
 
     def set_bluff_probability(self) -> float:
         """
-        Sets the bluff probability based on personality.
+        Returns the bluff probability of this personality.
         """
-        personality_bluffs = {
-            'aggressive': 0.2,
-            'passive': 0.05,
-            'balanced': 0.1,
-            'loose': 0.15,
-            'tight': 0.05
-        }
-        return personality_bluffs.get(self.personality, 0.1)
+        return self.bluff_probability
 
     def update_observations(self, game_state: Dict[str, Any]) -> None:
         """
@@ -75,36 +152,37 @@ class AIPlayer(Player):
         Parameters:
             game_state (dict): Information about the current game state.
         """
-        for player in game_state['players']:
+        observed_players = self.observed_players
+        players = game_state['players']
+        if self._opponent_aggr.shape[0] != len(players):
+            self._opponent_aggr = np.full(len(players), 0.5)
+        opponent_aggr = self._opponent_aggr
+        for seat, player in enumerate(players):
             if player.name == self.name:
                 continue
-            if player.name not in self.observed_players:
-                self.observed_players[player.name] = {
+            # Bind this opponent's record once and update it in place
+            obs = observed_players.get(player.name)
+            if obs is None:
+                obs = observed_players[player.name] = {
                     'aggressiveness': 0.5,
                     'bluffing_tendency': 0.1,
                     'hands_played': 0,
-                    'raises': 0,
-                    'calls': 0,
-                    'folds': 0
+                    # Counts per action code (fold, check, call, raise, all-in)
+                    'actions': array.array('I', [0] * len(ACTION_CODES))
                 }
             # Update observations based on player's actions
             # For simplicity, we'll increment counts based on observed actions
-            last_action = player.last_action if hasattr(player, 'last_action') else None
-            if last_action:
-                self.observed_players[player.name]['hands_played'] += 1
-                if 'raise' in last_action:
-                    self.observed_players[player.name]['raises'] += 1
-                elif 'call' in last_action:
-                    self.observed_players[player.name]['calls'] += 1
-                elif 'fold' in last_action:
-                    self.observed_players[player.name]['folds'] += 1
+            code = player.last_action_code
+            if code is not None:
+                obs['hands_played'] += 1
+                obs['actions'][code] += 1
             # Calculate aggressiveness and bluffing tendency
-            total_actions = self.observed_players[player.name]['hands_played']
+            total_actions = obs['hands_played']
             if total_actions > 0:
-                raises = self.observed_players[player.name]['raises']
-                self.observed_players[player.name]['aggressiveness'] = raises / total_actions
-                folds = self.observed_players[player.name]['folds']
-                self.observed_players[player.name]['bluffing_tendency'] = folds / total_actions
+                actions = obs['actions']
+                obs['aggressiveness'] = actions[RAISE] / total_actions
+                obs['bluffing_tendency'] = actions[FOLD] / total_actions
+            opponent_aggr[seat] = obs['aggressiveness']
 
     def decide_action(self, game_state: Dict[str, Any]) -> Tuple[str, float]:
         """
@@ -116,12 +194,20 @@ class AIPlayer(Player):
         Returns:
             Tuple[str, float]: The action ('fold', 'check', 'call', 'raise', 'all-in') and the bet amount.
         """
+        # Draw every uniform this decision may need in one call:
+        # [0] bluff check, [1] bluff sizing, [2] loose call when behind
+        self._u = self._rng.random(3).tolist()
+
         # Update observations about other players
         self.update_observations(game_state)
 
-        # Evaluate hand strength
-        hand_rank_value, highest_cards = HandEvaluator.evaluate_hand(self.hand, game_state['community_cards'])
-        hand_strength = hand_rank_value / 10  # Normalize to 0.1 - 1.0
+        # Opponents still in the hand, from the seat bitmask
+        opponents = game_state['active_mask'] & ~(1 << game_state['seat_index'][self])
+        opponent_mask = (opponents >> np.arange(len(game_state['players']))) & 1 == 1
+        opponent_aggressiveness = self._opponent_aggr[opponent_mask]
+
+        # Evaluate hand strength as Monte-Carlo equity against the remaining opponents
+        hand_strength = self.evaluate_hand_strength(game_state, self._rng)
 
         # Adjust hand strength based on the stage of the game
         stage_multiplier = self.get_stage_multiplier(game_state)
@@ -139,16 +225,17 @@ class AIPlayer(Player):
         hand_strength *= position_factor
 
         # Adjust hand strength based on observed players
-        hand_strength = self.adjust_hand_strength_based_on_observations(hand_strength, game_state)
+        hand_strength = self.adjust_hand_strength_based_on_observations(hand_strength, opponent_aggressiveness)
 
         # Decide whether to bluff
-        if self.should_bluff(hand_strength, game_state):
+        if self.should_bluff(hand_strength, opponent_aggressiveness):
             action = self.choose_bluff_action(call_amount)
         else:
             action = self.choose_action_based_on_hand_strength(hand_strength, pot_odds, call_amount)
 
         # Store the action for observation purposes
         self.last_action = action[0]
+        self.last_action_code = ACTION_CODES[action[0]]
         return action
 
     def get_stage_multiplier(self, game_state: Dict[str, Any]) -> float:
@@ -161,34 +248,7 @@ class AIPlayer(Player):
         Returns:
             float: Multiplier to adjust hand strength.
         """
-        stage = game_state['stage']  # 'pre-flop', 'flop', 'turn', 'river'
-        stage_multipliers = {
-            'pre-flop': 1.0,
-            'flop': 1.2,
-            'turn': 1.3,
-            'river': 1.4
-        }
-        return stage_multipliers.get(stage, 1.0)
-
-    def get_position(self, game_state: Dict[str, Any]) -> str:
-        """
-        Determines the player's position at the table.
-
-        Parameters:
-            game_state (dict): Information about the current game state.
-
-        Returns:
-            str: 'early', 'middle', or 'late'
-        """
-        total_players = len(game_state['players'])
-        active_players = [p for p in game_state['players'] if not p.folded]
-        index = active_players.index(self)
-        if index < len(active_players) / 3:
-            return 'early'
-        elif index < 2 * len(active_players) / 3:
-            return 'middle'
-        else:
-            return 'late'
+        return self.STAGE_MULTIPLIERS[game_state['stage']]
 
     def get_position_factor(self, position: str) -> float:
         """
@@ -200,73 +260,54 @@ class AIPlayer(Player):
         Returns:
             float: Position factor.
         """
-        position_factors = {
-            'early': 0.9,
-            'middle': 1.0,
-            'late': 1.1
-        }
-        return position_factors.get(position, 1.0)
-
-    def adjust_hand_strength_based_on_observations(self, hand_strength: float, game_state: Dict[str, Any]) -> float:
+        return self.POSITION_FACTORS.get(position, 1.0)
+
+    def adjust_hand_strength_based_on_observations(self, hand_strength: float, opponent_aggressiveness: np.ndarray) -> float:
         """
         Adjusts hand strength based on observations of other players.
 
         Parameters:
             hand_strength (float): The current evaluated hand strength.
-            game_state (dict): Information about the current game state.
+            opponent_aggressiveness (np.ndarray): Observed aggressiveness of each active opponent.
 
         Returns:
             float: Adjusted hand strength.
         """
-        for player in game_state['players']:
-            if player.name == self.name or player.folded:
-                continue
-            observed = self.observed_players.get(player.name, {})
-            aggressiveness = observed.get('aggressiveness', 0.5)
-            if aggressiveness > 0.7:
-                # Be cautious if opponents are aggressive
-                hand_strength *= 0.95
-            elif aggressiveness < 0.3:
-                # Exploit passive players
-                hand_strength *= 1.05
-        return hand_strength
-
-    def should_bluff(self, hand_strength: float, game_state: Dict[str, Any]) -> bool:
+        # Be cautious against aggressive opponents, exploit passive ones
+        cautious = np.count_nonzero(opponent_aggressiveness > 0.7)
+        exploit = np.count_nonzero(opponent_aggressiveness < 0.3)
+        return float(hand_strength * 0.95 ** cautious * 1.05 ** exploit)
+
+    def should_bluff(self, hand_strength: float, opponent_aggressiveness: np.ndarray) -> bool:
         """
         Determines if the AI should attempt a bluff.
 
         Parameters:
             hand_strength (float): The evaluated strength of the AI's hand.
-            game_state (dict): Information about the current game state.
+            opponent_aggressiveness (np.ndarray): Observed aggressiveness of each active opponent.
 
         Returns:
             bool: True if the AI decides to bluff, False otherwise.
         """
-        bluff_chance = random.random()
-        if hand_strength < 0.3 and bluff_chance < self.bluff_probability:
-            # Consider game context
-            if self.is_good_bluff_spot(game_state):
-                return True
-        return False
-
-    def is_good_bluff_spot(self, game_state: Dict[str, Any]) -> bool:
+        # Weak hand, good spot and the bluff draw folded into a single comparison
+        good_spot = self.is_good_bluff_spot(opponent_aggressiveness)
+        return self._u[0] < self.bluff_probability * (hand_strength < 0.3) * good_spot
+
+    def is_good_bluff_spot(self, opponent_aggressiveness: np.ndarray) -> bool:
         """
         Determines if the current game state is a good opportunity to bluff.
 
         Parameters:
-            game_state (dict): Information about the current game state.
+            opponent_aggressiveness (np.ndarray): Observed aggressiveness of each active opponent.
 
         Returns:
             bool: True if it's a good spot to bluff, False otherwise.
         """
-        active_players = [p for p in game_state['players'] if not p.folded and p.name != self.name]
-        if len(active_players) == 1:
+        if len(opponent_aggressiveness) == 1:
             # Bluffing heads-up can be effective
             return True
         # Check if all opponents are tight players
-        tight_opponents = all(
-            self.observed_players.get(p.name, {}).get('aggressiveness', 0.5) < 0.3 for p in active_players
-        )
+        tight_opponents = bool((opponent_aggressiveness < 0.3).all())
         return tight_opponents
 
     def choose_bluff_action(self, call_amount: float) -> Tuple[str, float]:
@@ -280,7 +321,7 @@ class AIPlayer(Player):
             Tuple[str, float]: The action and bet amount.
         """
         # Bluff by raising a significant amount
-        raise_amount = min(self.chips, call_amount + random.uniform(0.5, 1.0) * self.chips * self.aggression_factor)
+        raise_amount = min(self.chips, call_amount + (0.5 + 0.5 * self._u[1]) * self.chips * self.aggression_factor)
         return 'raise', raise_amount
 
     def choose_action_based_on_hand_strength(self, hand_strength: float, pot_odds: float, call_amount: float) -> Tuple[str, float]:
@@ -295,40 +336,46 @@ class AIPlayer(Player):
         Returns:
             Tuple[str, float]: The action and bet amount.
         """
-        # Compare hand strength to pot odds
-        if hand_strength >= pot_odds:
-            # Favorable situation
-            if hand_strength > 0.8:
-                # Strong hand, consider raising
-                raise_amount = min(self.chips, call_amount + pot_odds * self.chips * self.aggression_factor)
-                return 'raise', raise_amount
-            elif hand_strength > 0.5:
-                # Medium strength hand
-                if call_amount == 0:
-                    return 'check', 0.0
-                else:
-                    return 'call', call_amount
-            else:
-                # Marginal hand
-                if call_amount == 0:
-                    return 'check', 0.0
-                else:
-                    return 'call', call_amount
-        else:
-            # Unfavorable situation
-            if call_amount == 0:
-                # No cost to check
-                return 'check', 0.0
-            else:
-                # Decide to fold or call based on aggression
-                if self.aggression_factor > 1.0 and random.random() < 0.3:
-                    return 'call', call_amount
-                else:
-                    return 'fold', 0.0
+        # Look up the precomputed decision for this situation
+        strength_bucket = min(int(hand_strength * 10), 10)
+        odds_bucket = min(max(int(pot_odds * 10), 0), 9)
+        action = self._policy[strength_bucket][odds_bucket][call_amount != 0]
+
+        if action == RAISE:
+            raise_amount = min(self.chips, call_amount + pot_odds * self.chips * self.aggression_factor)
+            return 'raise', raise_amount
+        if action == _LOOSE_CALL:
+            # Call a fraction of the time when behind
+            action = CALL if self._u[2] < 0.3 else FOLD
+        if action == CALL:
+            return 'call', call_amount
+        if action == CHECK:
+            return 'check', 0.0
+        return 'fold', 0.0
+
+    def act(self, game_state: Dict[str, Any]) -> Tuple[str, float]:
+        """
+        Decides on and records an action without applying it, for a game loop that applies it.
+
+        Parameters:
+            game_state (dict): Information about the current game state.
+
+        Returns:
+            Tuple[str, float]: The action and, for calls and raises, the total bet it brings the AI to.
+        """
+        action, amount = self.decide_action(game_state)
+        self.record_decision(game_state, action, amount)
+        if action == 'call':
+            return 'call', game_state['current_bet']
+        elif action == 'raise':
+            return 'raise', self.current_bet + amount
+        elif action in ('fold', 'check', 'all-in'):
+            return action, 0.0
+        return 'fold', 0.0  # Default action if none matched
 
     def get_action(self, game_state: Dict[str, Any]) -> str:
         """
-        Overrides the base class method to return the AI's action.
+        Overrides the base class method to return the AI's action, applying it to the AI's own chips.
 
         Parameters:
             game_state (dict): Information about the current game state.
@@ -337,6 +384,7 @@ class AIPlayer(Player):
             str: The action chosen by the AI player.
         """
         action, amount = self.decide_action(game_state)
+        self.record_decision(game_state, action, amount)
         if action == 'fold':
             self.fold()
             return 'fold'
@@ -354,4 +402,60 @@ class AIPlayer(Player):
             self.all_in_bet()
             return 'all-in'
         else:
-            return 'fold'  # Default action if none matched
\ No newline at end of file
+            return 'fold'  # Default action if none matched
+
+
+class AggressiveAIPlayer(AIPlayer):
+    """
+    Bets and raises frequently, applies pressure on opponents.
+    """
+    __slots__ = ()
+    personality = 'aggressive'
+    aggression_factor = AIPlayer.AGGRESSION_FACTORS['aggressive']
+    bluff_probability = AIPlayer.BLUFF_PROBABILITIES['aggressive']
+
+
+class PassiveAIPlayer(AIPlayer):
+    """
+    Calls and checks more often, avoids confrontation.
+    """
+    __slots__ = ()
+    personality = 'passive'
+    aggression_factor = AIPlayer.AGGRESSION_FACTORS['passive']
+    bluff_probability = AIPlayer.BLUFF_PROBABILITIES['passive']
+
+
+class BalancedAIPlayer(AIPlayer):
+    """
+    A mix of aggressive and passive play, adapts to situations.
+    """
+    __slots__ = ()
+    personality = 'balanced'
+    aggression_factor = AIPlayer.AGGRESSION_FACTORS['balanced']
+    bluff_probability = AIPlayer.BLUFF_PROBABILITIES['balanced']
+
+
+class LooseAIPlayer(AIPlayer):
+    """
+    Plays many hands, willing to gamble with weaker holdings.
+    """
+    __slots__ = ()
+    personality = 'loose'
+    aggression_factor = AIPlayer.AGGRESSION_FACTORS['loose']
+    bluff_probability = AIPlayer.BLUFF_PROBABILITIES['loose']
+
+
+class TightAIPlayer(AIPlayer):
+    """
+    Plays few hands, waits for strong cards.
+    """
+    __slots__ = ()
+    personality = 'tight'
+    aggression_factor = AIPlayer.AGGRESSION_FACTORS['tight']
+    bluff_probability = AIPlayer.BLUFF_PROBABILITIES['tight']
+
+
+PERSONALITY_CLASSES: Dict[str, type] = {
+    cls.personality: cls
+    for cls in (AggressiveAIPlayer, PassiveAIPlayer, BalancedAIPlayer, LooseAIPlayer, TightAIPlayer)
+}
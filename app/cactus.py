@@ -0,0 +1,205 @@
+"""
+Cactus Kev five-card hand evaluator.
+
+Each card is a 32-bit integer::
+
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+with one bit per rank (b), one bit per suit (cdhs), the rank index (r) and a
+distinct prime per rank (p). A five-card hand is then ranked with a flush test
+(AND of the suit bits), a table lookup on the OR of the rank bits for flushes
+and five-distinct-rank hands, and for everything else a lookup keyed on the
+product of the rank primes, which is unique per rank multiset.
+
+Ranks follow Cactus Kev's numbering: 1 (royal flush) to 7462 (seven-high).
+The tables are generated at import time.
+"""
+
+from itertools import combinations
+from typing import List
+
+import numpy as np
+
+from .jit import njit, prange
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# First Cactus Kev rank of each hand category, best category first
+STRAIGHT_FLUSH, FOUR_OF_A_KIND, FULL_HOUSE, FLUSH, STRAIGHT = 1, 11, 167, 323, 1600
+THREE_OF_A_KIND, TWO_PAIR, ONE_PAIR, HIGH_CARD = 1610, 2468, 3326, 6186
+WORST_RANK = 7462
+
+# Rank masks of the ten straights, ace-high first; the last is the wheel
+STRAIGHT_MASKS = tuple(0b11111 << high for high in range(8, -1, -1)) + (0b1000000001111,)
+
+# Open-addressing table for the 4888 prime products: 2**13 slots, multiplicative hashing.
+# Products stay below 2**27, so product * multiplier never leaves int64.
+PRODUCT_HASH_BITS = 13
+PRODUCT_HASH_MASK = (1 << PRODUCT_HASH_BITS) - 1
+PRODUCT_HASH_MULTIPLIER = 2654435761
+
+
+def card_int(rank_index: int, suit_index: int) -> int:
+    """
+    Builds the Cactus Kev integer for a card.
+
+    Parameters:
+        rank_index (int): 0 (deuce) to 12 (ace).
+        suit_index (int): 0 to 3, as in Card.SUITS.
+
+    Returns:
+        int: The packed card.
+    """
+    return (1 << (16 + rank_index)) | (0x1000 << suit_index) | (rank_index << 8) | PRIMES[rank_index]
+
+
+# Cactus Kev integer for each Card.code (rank_index << 2 | suit_index)
+CARD_INTS = np.array([card_int(code >> 2, code & 3) for code in range(52)], dtype=np.int32)
+
+
+def _rank_masks_desc(exclude_straights: bool) -> List[int]:
+    # All five-bit rank masks, best (highest ranks) first
+    masks = [sum(1 << r for r in ranks) for ranks in combinations(range(12, -1, -1), 5)]
+    if exclude_straights:
+        masks = [mask for mask in masks if mask not in STRAIGHT_MASKS]
+    return masks
+
+
+def _prime_product(rank_indices) -> int:
+    product = 1
+    for r in rank_indices:
+        product *= PRIMES[r]
+    return product
+
+
+def _product_slot(product):
+    # Home slot of a product; also works elementwise on an array of products
+    return ((product * PRODUCT_HASH_MULTIPLIER) & 0xFFFFFFFF) >> (32 - PRODUCT_HASH_BITS)
+
+
+_product_slot_compiled = njit(cache=True)(_product_slot)
+
+
+def _build_product_hash(products, values):
+    keys = np.zeros(1 << PRODUCT_HASH_BITS, dtype=np.int32)
+    ranks = np.zeros(1 << PRODUCT_HASH_BITS, dtype=np.int16)
+    slots = _product_slot(products)
+    for product, rank, slot in zip(products.tolist(), values.tolist(), slots.tolist()):
+        while keys[slot]:
+            slot = (slot + 1) & PRODUCT_HASH_MASK
+        keys[slot] = product
+        ranks[slot] = rank
+    return keys, ranks
+
+
+def _build_tables():
+    flushes = np.zeros(8192, dtype=np.int16)
+    unique5 = np.zeros(8192, dtype=np.int16)
+    # Rank indices of each hand class, most significant first, indexed by Cactus Kev rank
+    classes = [()] * (WORST_RANK + 1)
+
+    for i, mask in enumerate(STRAIGHT_MASKS):
+        flushes[mask] = STRAIGHT_FLUSH + i
+        unique5[mask] = STRAIGHT + i
+        high = 3 if i == len(STRAIGHT_MASKS) - 1 else 12 - i
+        classes[STRAIGHT_FLUSH + i] = classes[STRAIGHT + i] = tuple((high - k) % 13 for k in range(5))
+    for i, mask in enumerate(_rank_masks_desc(exclude_straights=True)):
+        flushes[mask] = FLUSH + i
+        unique5[mask] = HIGH_CARD + i
+        classes[FLUSH + i] = classes[HIGH_CARD + i] = tuple(r for r in range(12, -1, -1) if mask >> r & 1)
+
+    # Hands with a repeated rank, keyed by the product of their primes
+    keyed = {}
+
+    def add(rank, rank_indices):
+        keyed[_prime_product(rank_indices)] = rank
+        classes[rank] = tuple(rank_indices)
+        return rank + 1
+
+    rank = FOUR_OF_A_KIND
+    for quad in range(12, -1, -1):
+        for kicker in range(12, -1, -1):
+            if kicker != quad:
+                rank = add(rank, [quad] * 4 + [kicker])
+    for trips in range(12, -1, -1):
+        for pair in range(12, -1, -1):
+            if pair != trips:
+                rank = add(rank, [trips] * 3 + [pair] * 2)
+    rank = THREE_OF_A_KIND
+    for trips in range(12, -1, -1):
+        others = [r for r in range(12, -1, -1) if r != trips]
+        for kickers in combinations(others, 2):
+            rank = add(rank, [trips] * 3 + list(kickers))
+    for high, low in combinations(range(12, -1, -1), 2):
+        for kicker in range(12, -1, -1):
+            if kicker not in (high, low):
+                rank = add(rank, [high, high, low, low, kicker])
+    for pair in range(12, -1, -1):
+        others = [r for r in range(12, -1, -1) if r != pair]
+        for kickers in combinations(others, 3):
+            rank = add(rank, [pair, pair] + list(kickers))
+
+    products = np.array(sorted(keyed), dtype=np.int64)
+    values = np.array([keyed[p] for p in products], dtype=np.int16)
+    return flushes, unique5, products, values, tuple(classes)
+
+
+FLUSHES, UNIQUE5, PRODUCTS, PRODUCT_RANKS, RANK_CLASSES = _build_tables()
+PRODUCT_HASH_KEYS, PRODUCT_HASH_RANKS = _build_product_hash(PRODUCTS, PRODUCT_RANKS)
+
+
+@njit(cache=True)
+def eval5(c1, c2, c3, c4, c5):
+    """
+    Ranks five Cactus Kev cards: 1 (royal flush) to 7462 (seven-high).
+    """
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSHES[q]
+    rank = UNIQUE5[q]
+    if rank:
+        return rank
+    product = np.int64(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+    slot = _product_slot_compiled(product)
+    while PRODUCT_HASH_KEYS[slot] != product:
+        slot = (slot + 1) & PRODUCT_HASH_MASK
+    return PRODUCT_HASH_RANKS[slot]
+
+
+@njit(cache=True, nogil=True)
+def best_int_rank(cards):
+    """
+    Finds the best five-card hand among five to seven Cactus Kev card integers.
+
+    Parameters:
+        cards (np.ndarray): Cactus Kev integers, as in Card.int_repr.
+
+    Returns:
+        int: The best Cactus Kev rank, 1 (royal flush) to 7462 (seven-high).
+    """
+    n = cards.shape[0]
+    best = WORST_RANK + 1
+    for a in range(n - 4):
+        for b in range(a + 1, n - 3):
+            for c in range(b + 1, n - 2):
+                for d in range(c + 1, n - 1):
+                    for e in range(d + 1, n):
+                        rank = eval5(cards[a], cards[b], cards[c], cards[d], cards[e])
+                        if rank < best:
+                            best = rank
+    return best
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def best_int_rank_batch(hands):
+    """
+    Evaluates an (N, K) array of Cactus Kev card integers, one hand per row.
+
+    Returns:
+        np.ndarray: The best Cactus Kev rank of each row.
+    """
+    n = hands.shape[0]
+    ranks = np.empty(n, np.int64)
+    for i in prange(n):
+        ranks[i] = best_int_rank(hands[i])
+    return ranks
@@ -1,21 +1,88 @@
 from typing import Literal
 
+from .cactus import card_int
+
 
 class Card:
-    SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-    RANKS = {
-        '2': 2, '3': 3, '4': 4, '5': 5, '6': 6,
-        '7': 7, '8': 8, '9': 9, '10': 10,
-        'Jack': 11, 'Queen': 12, 'King': 13, 'Ace': 14
-    }
+    """
+    A playing card packed into a single integer code in the range 0..51.
+
+    The code is laid out as ``(rank_index << 2) | suit_index`` so the rank and
+    suit can be recovered with a shift and a mask, and ``range(52)`` enumerates
+    a full deck. ``int_repr`` is the same card in Cactus Kev's 32-bit layout
+    (see ``app.cactus``), which the hand evaluator works on directly.
+
+    ``rank_int`` (2 for a deuce through 14 for an ace) and ``suit_int`` (the
+    index into ``SUITS``) are unpacked once at construction.
+
+    Cards are immutable and hash by ``int_repr``, so they can key caches.
+    """
+
+    __slots__ = ('code', 'int_repr', 'rank_int', 'suit_int')
+
+    SUITS = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+    RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
 
     def __init__(
-        self, 
-        suit: Literal['Hearts', 'Diamonds', 'Clubs', 'Spades'], 
+        self,
+        suit: Literal['Hearts', 'Diamonds', 'Clubs', 'Spades'],
         rank: Literal['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
     ):
-        self.suit = suit
-        self.rank = rank
+        self._unpack((RANK_INDEX[rank] << 2) | SUIT_INDEX[suit])
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Card':
+        """
+        Builds a card directly from its integer code.
+
+        Parameters:
+            code (int): The packed card code (0..51).
+
+        Returns:
+            Card: The corresponding card.
+        """
+        card = cls.__new__(cls)
+        card._unpack(int(code))
+        return card
+
+    def _unpack(self, code: int) -> None:
+        # Sets every field from the code; the only writes an immutable card allows
+        object.__setattr__(self, 'code', code)
+        object.__setattr__(self, 'int_repr', card_int(code >> 2, code & 3))
+        object.__setattr__(self, 'rank_int', (code >> 2) + 2)
+        object.__setattr__(self, 'suit_int', code & 3)
+
+    @property
+    def suit(self) -> str:
+        return Card.SUITS[self.suit_int]
+
+    @property
+    def rank(self) -> str:
+        return Card.RANKS[self.rank_int - 2]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card is immutable; cannot set {name}.")
+
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.code == other.code
+
+    def __hash__(self):
+        return self.int_repr
+
+    def __reduce__(self):
+        return Card.from_code, (self.code,)
 
     def __repr__(self):
-        return f"{self.rank} of {self.suit}"
+        return CARD_NAMES[self.code]
+
+
+SUIT_INDEX = {suit: index for index, suit in enumerate(Card.SUITS)}
+RANK_INDEX = {rank: index for index, rank in enumerate(Card.RANKS)}
+
+# Display name of each card code, built once rather than formatted on every repr
+CARD_NAMES = tuple(f"{Card.RANKS[code >> 2]} of {Card.SUITS[code & 3]}" for code in range(52))
+
+# One shared instance per card code, so dealing from an integer deck never allocates.
+CARDS = tuple(Card.from_code(code) for code in range(52))
@@ -1,16 +1,51 @@
 # data_collector.py
 
+import array
+import csv
+import os
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+from .logger import logger
+
+Column = Union[List[Any], array.array]
 
 class DataCollector:
     """
     Collects data from poker game simulations for machine learning purposes.
+
+    Records are stored column-wise: one sequence per field, all of the same
+    length. Float fields are kept in ``array.array('d')`` buffers so they are
+    stored unboxed and hand straight to pandas when the dataset is built.
+
+    If ``stream_path`` is given, every ``batch_size`` records are written out
+    and dropped from memory, so long simulations run in bounded memory.
+    A path ending in ``.csv`` receives CSV rows; any other path an Arrow IPC
+    file of record batches. ``close()`` flushes the remainder. Arrow streaming
+    and Parquet output require ``pyarrow``.
     """
 
-    def __init__(self):
-        # Initialize an empty list to store records
-        self.records: List[Dict[str, Any]] = []
+    def __init__(self, stream_path: Optional[str] = None, batch_size: int = 1024):
+        # Initialize an empty columnar buffer
+        self._columns: Dict[str, Column] = {}
+        self._num_records: int = 0
+
+        # Optional CSV or Arrow IPC sink, opened on the first flush
+        self.stream_path = stream_path
+        self.batch_size = batch_size
+        self._writer = None
+        self._schema = None
+        self._file = None
+        self._num_flushed: int = 0
+
+    @staticmethod
+    def _new_column(value: Any, length: int) -> Column:
+        """
+        Creates a column suited to the type of its first value, back-filled to the given length.
+        """
+        if isinstance(value, float):
+            return array.array('d', [float('nan')]) * length
+        return [None] * length
 
     def record_decision_point(self, data: Dict[str, Any]) -> None:
         """
@@ -19,8 +54,132 @@ class DataCollector:
         Parameters:
             data (Dict[str, Any]): A dictionary containing data fields.
         """
-        self.records.append(data)
-        
+        columns = self._columns
+        num_records = self._num_records
+        for key, value in data.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = self._new_column(value, num_records)
+            try:
+                column.append(value)
+            except TypeError:
+                # A non-float value reached a float column; fall back to a plain list
+                column = columns[key] = list(column)
+                column.append(value)
+        self._num_records = num_records + 1
+
+        # Pad any fields this record did not provide
+        if len(data) != len(columns):
+            for column in columns.values():
+                if len(column) == num_records:
+                    column.append(float('nan') if isinstance(column, array.array) else None)
+
+        if self.stream_path is not None and self._num_records >= self.batch_size:
+            self.flush()
+
+    def extend(self, other: 'DataCollector') -> None:
+        """
+        Appends the records buffered in another collector, such as one filled by a worker process.
+
+        Parameters:
+            other (DataCollector): The collector whose records are appended.
+        """
+        num_records, num_new = self._num_records, other._num_records
+        if num_new == 0:
+            return
+        columns = self._columns
+        for key, new_column in other._columns.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = (
+                    array.array('d', [float('nan')]) * num_records
+                    if isinstance(new_column, array.array) else [None] * num_records
+                )
+            try:
+                column.extend(new_column)
+            except TypeError:
+                column = columns[key] = list(column)
+                column.extend(new_column)
+        self._num_records = num_records + num_new
+
+        # Pad any fields the other collector did not have
+        for key, column in columns.items():
+            if len(column) == num_records:
+                column.extend(array.array('d', [float('nan')]) * num_new if isinstance(column, array.array) else [None] * num_new)
+
+        if self.stream_path is not None and self._num_records >= self.batch_size:
+            self.flush()
+
+    def _write_csv(self) -> None:
+        """
+        Appends the buffered records to the CSV stream file as rows.
+        """
+        # The first batch fixes the header; later batches are written in its column order
+        if self._writer is None:
+            self._file = open(self.stream_path, 'w', newline='')
+            # Line endings as pandas writes them
+            self._writer = csv.writer(self._file, lineterminator=os.linesep)
+            self._schema = list(self._columns)
+            self._writer.writerow(self._schema)
+        elif len(self._columns) > len(self._schema):
+            new_fields = [key for key in self._columns if key not in self._schema]
+            logger.warning("Fields {} first appeared after the CSV header was written and are not saved.", new_fields)
+
+        # Missing values are empty fields, as pandas writes them
+        missing = [None] * self._num_records
+        columns = [
+            ['' if value != value else value for value in self._columns.get(key, missing)]
+            for key in self._schema
+        ]
+        self._writer.writerows(zip(*columns))
+
+    def _write_arrow(self) -> None:
+        """
+        Appends the buffered records to the Arrow IPC stream file as a record batch.
+        """
+        import pyarrow as pa
+
+        # The first batch fixes the schema; later batches are cast to it
+        batch = pa.RecordBatch.from_pydict(self._columns, schema=self._schema)
+        if self._writer is None:
+            self._schema = batch.schema
+            self._writer = pa.ipc.new_file(self.stream_path, self._schema)
+        self._writer.write_batch(batch)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the stream file and clears the buffer.
+        Does nothing unless the collector was created with a ``stream_path``.
+        """
+        if self.stream_path is None or self._num_records == 0:
+            return
+
+        if self.stream_path.endswith('.csv'):
+            self._write_csv()
+        else:
+            self._write_arrow()
+
+        self._num_flushed += self._num_records
+        self._num_records = 0
+        # Keep the field order and column types for the next batch
+        self._columns = {
+            key: array.array('d') if isinstance(column, array.array) else []
+            for key, column in self._columns.items()
+        }
+
+    def close(self) -> None:
+        """
+        Flushes any remaining records and closes the stream file.
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        self._schema = None
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Returns statistics about the collected data.
@@ -28,36 +187,51 @@ class DataCollector:
         Returns:
             Dict[str, Any]: A dictionary containing statistics.
         """
-        stats = {}
-        if self.records:
-            stats['num_records'] = len(self.records)
-            stats['fields'] = list(self.records[0].keys())
-        else:
-            stats['num_records'] = 0
-            stats['fields'] = []
-        return stats
+        return {
+            'num_records': self._num_flushed + self._num_records,
+            'fields': list(self._columns.keys()),
+        }
 
     def get_dataset(self) -> pd.DataFrame:
         """
         Returns the collected data as a Pandas DataFrame.
+        When streaming, only the records not yet flushed are included.
 
         Returns:
             pd.DataFrame: The dataset.
         """
-        return pd.DataFrame(self.records)
+        return pd.DataFrame(self._columns, copy=False)
 
     def save_to_csv(self, filename: str) -> None:
         """
         Saves the dataset to a CSV file.
+        When already streaming to that file, the stream is flushed and closed instead.
 
         Parameters:
             filename (str): The name of the CSV file.
         """
+        if self.stream_path == filename:
+            self.close()
+            return
         df = self.get_dataset()
         df.to_csv(filename, index=False)
 
+    def save_to_parquet(self, filename: str) -> None:
+        """
+        Saves the dataset to a Parquet file, writing the columns directly through Arrow.
+
+        Parameters:
+            filename (str): The name of the Parquet file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.Table.from_pydict(self._columns), filename)
+
     def reset(self) -> None:
         """
         Clears the collected records.
         """
-        self.records = []
+        self._columns = {}
+        self._num_records = 0
+        self._num_flushed = 0
@@ -1,17 +1,53 @@
-import random
-from .card import Card
+from typing import List
+
+import numpy as np
+from .card import Card, CARDS
 
 class Deck:
+    """
+    A deck of 52 cards stored as a contiguous array of integer card codes.
+
+    Cards are dealt by advancing a pointer into the array rather than popping,
+    and are only turned into Card objects when they leave the deck.
+    """
+
+    # Built once; every new deck is a straight copy of these 52 bytes
+    _PROTOTYPE: np.ndarray = np.arange(52, dtype=np.uint8)
+    _RNG: np.random.Generator = np.random.default_rng()
+
     def __init__(self):
-        self.cards = [Card(suit, rank) for suit in Card.SUITS for rank in Card.RANKS.keys()]
+        self.cards: np.ndarray = Deck._PROTOTYPE.copy()
+        self._top: int = 0
+        self._rng = Deck._RNG
+
+    def reset(self):
+        # Return every card to the deck; the array always holds all 52 codes, so nothing is reallocated
+        self._top = 0
+
+    def __len__(self) -> int:
+        return len(self.cards) - self._top
 
     def shuffle(self, count: int = 1):
+        # Only the undealt part of the deck is shuffled
         for _ in range(count):
-            random.shuffle(self.cards)
+            self._rng.shuffle(self.cards[self._top:])
             
     def cut(self):
-        cut_index = random.randint(0, len(self.cards))
-        self.cards[:cut_index], self.cards[cut_index:] = self.cards[cut_index:], self.cards[:cut_index]
+        # Rotate the undealt cards in place so the cut point becomes the top
+        cut_index = int(self._rng.integers(0, len(self) + 1))
+        undealt = self.cards[self._top:]
+        undealt[:] = np.roll(undealt, -cut_index)
+
+    def deal(self) -> Card:
+        if self._top >= len(self.cards):
+            raise IndexError("deal from empty deck")
+        code = self.cards[self._top]
+        self._top += 1
+        return CARDS[code]
 
-    def deal(self):
-        return self.cards.pop()
+    def deal_many(self, count: int) -> List[Card]:
+        if self._top + count > len(self.cards):
+            raise IndexError("deal from empty deck")
+        codes = self.cards[self._top:self._top + count]
+        self._top += count
+        return [CARDS[code] for code in codes.tolist()]
@@ -1,12 +1,51 @@
-from typing import List, Literal, Optional, Dict, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
 from .logger import logger
 from .card import Card
 from .deck import Deck
-from .player import Player
+from .player import Player, Stage
 from .ai import AIPlayer
 from .hand_evaluator import HandEvaluator
+from .cactus import CARD_INTS
 from .data_collector import DataCollector
 
+def _parse_fold(rest: str, current_bet: float) -> Tuple[str, float]:
+    return 'fold', 0.0
+
+
+def _parse_check(rest: str, current_bet: float) -> Tuple[str, float]:
+    return 'check', 0.0
+
+
+def _parse_call(rest: str, current_bet: float) -> Tuple[str, float]:
+    return 'call', current_bet
+
+
+def _parse_raise(rest: str, current_bet: float) -> Tuple[str, float]:
+    # "raise to <amount>"; anything else doubles the current bet
+    keyword, _, amount = rest.partition(' ')
+    if keyword == 'to':
+        try:
+            return 'raise', float(amount)
+        except ValueError:
+            pass
+    return 'raise', current_bet * 2
+
+
+def _parse_all_in(rest: str, current_bet: float) -> Tuple[str, float]:
+    return 'all-in', 0.0
+
+
+# Action parsers keyed on the first word of an action string
+_ACTIONS: Dict[str, Callable[[str, float], Tuple[str, float]]] = {
+    'fold': _parse_fold,
+    'check': _parse_check,
+    'call': _parse_call,
+    'raise': _parse_raise,
+    'all-in': _parse_all_in,
+}
+
+
 class Game:
     """
     Represents the poker game, managing players, rounds, and game flow.
@@ -27,34 +66,45 @@ class Game:
         self.small_blind: float = small_blind
         self.big_blind: float = big_blind
         self.dealer_position: int = -1  # Will be set in rotate_positions
-        self.game_stage: Literal[
-            'pre-flop',
-            'flop',
-            'turn',
-            'river'
-        ] = 'pre-flop'
-        self.active_players: List[Player] = []
+        self.stage: Stage = Stage.PREFLOP
+        # Players still in the hand in seat order; a dict so folding a player is O(1)
+        self.active_players: Dict[Player, None] = {}
+        # Seats still in the hand, bit i for seat i; kept in step with active_players
+        self.active_mask: int = 0
+        self._n_can_act: int = 0
+        self._n_acted: int = 0
+        # Players able to act whose bet is below the current bet
+        self._unmatched_count: int = 0
+        # Seats in betting order, starting left of the dealer; rebuilt when the button moves
+        self._seat_order: List[int] = []
         self.round_active: bool = False
         self.betting_phase: bool = False
         self.current_player_index: int = 0
+        # Keyed by the player object, so players who share a name keep their own seats
+        self.seat_index: Dict[Player, int] = {player: seat for seat, player in enumerate(self.players)}
         self.data_collector = data_collector or DataCollector()
+        # Reused by get_game_state rather than rebuilt for every decision
+        self._state: Dict[str, any] = {}
 
     def __repr__(self):
-        return "\n".join([f"{k.title()}: {v}" for k,v in self.get_game_state().items()])
+        state = dict(self.get_game_state(), data_collector=self.get_data_stats())
+        return "\n".join([f"{k.title()}: {v}" for k,v in state.items()])
 
     def add_player(self, player: Player) -> None:
         """
         Adds a player to the game.
         """
         player.data_collector = self.data_collector
+        self.seat_index[player] = len(self.players)
         self.players.append(player)
-        logger.info(f"Added player {player.name} with {player.chips} chips.")
+        logger.info("Added player {} with {} chips.", player.name, player.chips)
 
     def remove_broke_players(self) -> None:
         """
         Removes players who have no chips left from the game.
         """
-        self.players = [player for player in self.players if player.chips > 0]
+        self.players[:] = [player for player in self.players if player.chips > 0]
+        self.seat_index = {player: seat for seat, player in enumerate(self.players)}
         logger.info("Removed players with zero chips.")
 
     def rotate_positions(self) -> None:
@@ -78,10 +128,11 @@ class Game:
         big_blind_position = (self.dealer_position + 2) % num_players
         self.players[small_blind_position].set_small_blind(True)
         self.players[big_blind_position].set_big_blind(True)
+        self._seat_order = [(self.dealer_position + 1 + i) % num_players for i in range(num_players)]
 
-        logger.info(f"Dealer is {dealer.name}.")
-        logger.info(f"Small blind is {self.players[small_blind_position].name}.")
-        logger.info(f"Big blind is {self.players[big_blind_position].name}.")
+        logger.info("Dealer is {}.", dealer.name)
+        logger.info("Small blind is {}.", self.players[small_blind_position].name)
+        logger.info("Big blind is {}.", self.players[big_blind_position].name)
 
     def collect_blinds(self) -> None:
         """
@@ -93,13 +144,13 @@ class Game:
                 player.place_bet(blind_amount)
                 self.pot += blind_amount
                 self.current_bet = blind_amount
-                logger.info(f"{player.name} posts small blind of {blind_amount}.")
+                logger.info("{} posts small blind of {}.", player.name, blind_amount)
             elif player.is_big_blind:
                 blind_amount = min(self.big_blind, player.chips)
                 player.place_bet(blind_amount)
                 self.pot += blind_amount
                 self.current_bet = blind_amount
-                logger.info(f"{player.name} posts big blind of {blind_amount}.")
+                logger.info("{} posts big blind of {}.", player.name, blind_amount)
 
     def start_new_round(self) -> None:
         """
@@ -111,13 +162,13 @@ class Game:
             self.round_active = False
             return
 
-        self.deck = Deck()
-        self.deck.cut()
+        # Reuse the same deck array; a full in-place shuffle makes a separate cut redundant
+        self.deck.reset()
         self.deck.shuffle()
-        self.community_cards = []
+        self.community_cards.clear()
         self.pot = 0.0
         self.current_bet = 0.0
-        self.game_stage = 'pre-flop'
+        self.stage = Stage.PREFLOP
         self.round_active = True
         self.betting_phase = True
         self.current_player_index = 0
@@ -126,165 +177,213 @@ class Game:
         self.rotate_positions()
 
         # Reset players and deal hands
-        self.active_players = [player for player in self.players if player.chips > 0]
+        self.set_active_players(player for player in self.players if player.chips > 0)
         for player in self.active_players:
-            player.reset_hand()
-            player.receive_card(self.deck.deal())
-            player.receive_card(self.deck.deal())
-            logger.info(f"{player.name} receives two cards.")
+            player.reset()
+            for card in self.deck.deal_many(2):
+                player.receive_card(card)
+            logger.info("{} receives two cards.", player.name)
 
         # Collect blinds
         self.collect_blinds()
 
+    def set_active_players(self, players: Iterable[Player]) -> None:
+        """
+        Puts the given players in the hand, rebuilding active_players and active_mask together.
+        """
+        self.active_players = dict.fromkeys(players)
+        self.active_mask = 0
+        for player in self.active_players:
+            self.active_mask |= 1 << self.seat_index[player]
+
+    def fold_player(self, player: Player) -> None:
+        """
+        Folds a player and drops them from the live views of the hand.
+        """
+        player.fold()
+        self.active_mask &= ~(1 << self.seat_index[player])
+        self.active_players.pop(player, None)
+
     def get_game_state(self) -> Dict[str, any]:
         """
         Returns a dictionary containing the current game state.
+
+        The same dictionary is refreshed in place and returned on every call, so
+        consumers should read from it rather than hold on to it between decisions.
+        Data collector statistics are available separately from get_data_stats.
+        """
+        state = self._state
+        state['community_cards'] = self.community_cards
+        state['current_bet'] = self.current_bet
+        state['pot'] = self.pot
+        state['players'] = self.players
+        state['active_players'] = self.active_players
+        state['active_mask'] = self.active_mask
+        state['seat_index'] = self.seat_index
+        state['stage'] = self.stage
+        state['dealer_position'] = self.dealer_position
+        state['small_blind'] = self.small_blind
+        state['big_blind'] = self.big_blind
+        state['betting_phase'] = self.betting_phase
+        state['current_player_index'] = self.current_player_index
+        state['round_active'] = self.round_active
+        return state
+
+    def get_data_stats(self) -> Optional[Dict[str, any]]:
+        """
+        Returns the data collector's statistics, if a collector is attached.
         """
-        return {
-            'community_cards': self.community_cards,
-            'current_bet': self.current_bet,
-            'pot': self.pot,
-            'players': self.players,
-            'active_players': self.active_players,
-            'stage': self.game_stage,
-            'dealer_position': self.dealer_position,
-            'current_bet': self.current_bet,
-            'small_blind': self.small_blind,
-            'big_blind': self.big_blind,
-            'betting_phase': self.betting_phase,
-            'current_player_index': self.current_player_index,
-            'round_active': self.round_active,
-            'data_collector': self.data_collector.get_stats() if self.data_collector else None
-        }
+        return self.data_collector.get_stats() if self.data_collector else None
 
     def parse_action(self, action_str: str) -> Tuple[str, float]:
         """
         Parses the action string into an action and amount.
         """
-        parts = action_str.lower().split()
-        if 'fold' in parts:
-            return 'fold', 0.0
-        elif 'check' in parts:
-            return 'check', 0.0
-        elif 'call' in parts:
-            return 'call', self.current_bet
-        elif 'raise' in parts:
-            # Extract the amount
-            try:
-                amount_index = parts.index('to') + 1
-                amount = float(parts[amount_index])
-            except (ValueError, IndexError):
-                amount = self.current_bet * 2  # Default raise amount
-            return 'raise', amount
-        elif 'all-in' in parts:
-            return 'all-in', 0.0
-        else:
-            return 'fold', 0.0  # Default action
+        token, _, rest = action_str.strip().lower().partition(' ')
+        return _ACTIONS.get(token, _parse_fold)(rest, self.current_bet)
+
+    def request_action(self, player: Player, game_state: Dict[str, any]) -> Tuple[str, float]:
+        """
+        Asks a player for their action. AI players answer with an (action, amount)
+        tuple directly; anyone else answers with a string that is parsed.
+        """
+        if isinstance(player, AIPlayer):
+            return player.act(game_state)
+        return self.parse_action(player.get_action(game_state))
 
     def betting_round(self) -> None:
         """
         Executes a betting round where players can fold, check, call, raise, or go all-in.
         """
-        # Reset current bets for the new betting round
-        for player in self.active_players:
-            player.current_bet = 0.0
-
-        # Build action order starting from the player after the dealer
-        num_players = len(self.players)
+        # Reset current bets for the new betting round; pre-flop bets are the posted blinds
+        if self.stage != Stage.PREFLOP:
+            self.current_bet = 0.0
+            for player in self.active_players:
+                player.current_bet = 0.0
+
+        # Action order starts from the player after the dealer
+        active_players = self.active_players
         action_order = []
-        index = (self.dealer_position + 1) % num_players
-        while len(action_order) < len(self.active_players):
-            player = self.players[index]
-            if player in self.active_players and not player.folded and not player.all_in:
+        for seat in self._seat_order:
+            player = self.players[seat]
+            player.acted = False
+            if player in active_players and not player.all_in:
                 action_order.append(player)
-            index = (index + 1) % num_players
 
-        # Keep track of players who have acted
-        players_who_acted = set()
+        # Players still able to act, and how many of them have acted since the last raise
+        self._n_can_act = len(action_order)
+        self._n_acted = 0
+        self._unmatched_count = sum(player.current_bet != self.current_bet for player in action_order)
 
         while True:
-            all_bets_equal = True
             for player in action_order:
                 if player.folded or player.all_in:
                     continue
 
                 # Check if all players have acted and bets are equal
-                if players_who_acted == set(self.active_players) and all_bets_equal:
+                if self._n_acted >= self._n_can_act and self._unmatched_count == 0:
                     logger.info("Betting round complete.")
                     return
 
+                was_unmatched = player.current_bet != self.current_bet
+                bet_before = self.current_bet
+
                 # Prepare game state to pass to players
                 game_state = self.get_game_state()
 
                 # Get player's action
-                action_str = player.get_action(game_state)
-                action, amount = self.parse_action(action_str)
-                logger.info(f"{player.name} decides to {action_str}")
+                action, amount = self.request_action(player, game_state)
+                logger.info("{} decides to {}.", player.name, action)
+
+                # Raising to no more than the current bet raises nothing (and would hand
+                # chips back below the player's own bet), so it is played as a call
+                if action == 'raise' and amount <= self.current_bet:
+                    logger.warning("{} cannot raise to {}; the bet is {}. Calling instead.", player.name, amount, self.current_bet)
+                    action = 'call'
 
                 # Handle the player's action
                 if action == 'fold':
-                    player.fold()
-                    logger.info(f"{player.name} folds.")
-                    self.active_players.remove(player)
+                    self.fold_player(player)
+                    logger.info("{} folds.", player.name)
                 elif action == 'check':
                     if player.current_bet < self.current_bet:
-                        logger.warning(f"{player.name} cannot check and must call or fold.")
+                        logger.warning("{} cannot check and must call or fold.", player.name)
                         continue
-                    logger.info(f"{player.name} checks.")
+                    logger.info("{} checks.", player.name)
                 elif action == 'call':
                     call_amount = self.current_bet - player.current_bet
                     if call_amount > player.chips:
                         call_amount = player.chips
                     player.call(self.current_bet)
                     self.pot += call_amount
-                    logger.info(f"{player.name} calls {call_amount}.")
+                    logger.info("{} calls {}.", player.name, call_amount)
                 elif action == 'raise':
-                    raise_amount = amount - player.current_bet
-                    if raise_amount > player.chips:
-                        raise_amount = player.chips
-                    player.raise_bet(amount)
-                    self.current_bet = amount
+                    # The amount is the total to raise to; only the difference is added
+                    raise_amount = min(amount - player.current_bet, player.chips)
+                    player.raise_bet(raise_amount)
                     self.pot += raise_amount
-                    logger.info(f"{player.name} raises to {self.current_bet}.")
-                    players_who_acted = set()  # Reset because the bet increased
+                    logger.info("{} raises to {}.", player.name, player.current_bet)
+                    if player.current_bet > self.current_bet:
+                        self.current_bet = player.current_bet
+                        self.reopen_action(action_order)
                 elif action == 'all-in':
                     all_in_amount = player.chips
                     player.all_in_bet()
                     self.pot += all_in_amount
-                    self.current_bet = max(self.current_bet, player.current_bet)
-                    logger.info(f"{player.name} goes all-in with {all_in_amount}.")
-                    if player.chips == 0:
-                        player.all_in = True
+                    logger.info("{} goes all-in with {}.", player.name, all_in_amount)
+                    if player.current_bet > self.current_bet:
+                        self.current_bet = player.current_bet
+                        self.reopen_action(action_order)
                 else:
-                    logger.warning(f"{player.name} performed an invalid action.")
+                    logger.warning("{} performed an invalid action.", player.name)
                     continue
 
-                players_who_acted.add(player)
-
-                # Check if all active players have matched the current bet
-                all_bets_equal = all(
-                    p.folded or p.all_in or p.current_bet == self.current_bet
-                    for p in self.active_players
-                )
-                if all_bets_equal and players_who_acted == set(self.active_players):
+                if player.folded or player.all_in:
+                    # They can no longer act, so they leave both counts
+                    self._n_can_act -= 1
+                    if player.acted:
+                        player.acted = False
+                        self._n_acted -= 1
+                elif not player.acted:
+                    player.acted = True
+                    self._n_acted += 1
+
+                # Keep the count of players who still owe chips up to date
+                if self.current_bet > bet_before:
+                    # Everyone else still able to act must now respond to the raise
+                    self._unmatched_count = self._n_can_act - (not (player.folded or player.all_in))
+                elif was_unmatched and (player.folded or player.all_in or player.current_bet == self.current_bet):
+                    self._unmatched_count -= 1
+                if self._unmatched_count == 0 and self._n_acted >= self._n_can_act:
                     logger.info("Betting round complete.")
                     return
 
-            # Remove folded players from action_order
-            action_order = [p for p in action_order if not p.folded]
-            # Check if only one player remains
-            if len(action_order) <= 1:
+            # Drop players who folded or went all-in from action_order
+            action_order = [p for p in action_order if not p.folded and not p.all_in]
+            # With at most one player left to act, the round ends once nobody owes a call;
+            # a last player facing an all-in must still call or fold
+            if len(action_order) <= 1 and self._unmatched_count == 0:
                 logger.info("Only one player remains. Betting round ends.")
                 return
 
+    def reopen_action(self, action_order: List[Player]) -> None:
+        """
+        Clears every player's acted flag after the bet is raised, so they must act again.
+        """
+        for player in action_order:
+            player.acted = False
+        self._n_acted = 0
+
     def deal_community_cards(self, number: int) -> None:
         """
         Deals community cards onto the table.
         """
-        for _ in range(number):
-            card = self.deck.deal()
-            self.community_cards.append(card)
-            logger.info(f"Dealt community card: {card}")
+        cards = self.deck.deal_many(number)
+        self.community_cards.extend(cards)
+        for card in cards:
+            logger.info("Dealt community card: {}", card)
+        for player in self.active_players:
+            player.on_street_update(self.community_cards)
 
     def play_round(self) -> None:
         """
@@ -295,30 +394,31 @@ class Game:
             return
 
         logger.info("Starting a new round...")
-        logger.info(f"Dealer is {self.players[self.dealer_position].name}")
+        logger.info("Dealer is {}", self.players[self.dealer_position].name)
 
         # Pre-flop betting round
         self.betting_round()
 
         # If more than one player remains, proceed to the flop
         if len(self.active_players) > 1:
-            self.game_stage = 'flop'
+            self.stage = Stage.FLOP
             self.deal_community_cards(3)  # Flop
             self.betting_round()
 
         # If more than one player remains, proceed to the turn
         if len(self.active_players) > 1:
-            self.game_stage = 'turn'
+            self.stage = Stage.TURN
             self.deal_community_cards(1)  # Turn
             self.betting_round()
 
         # If more than one player remains, proceed to the river
         if len(self.active_players) > 1:
-            self.game_stage = 'river'
+            self.stage = Stage.RIVER
             self.deal_community_cards(1)  # River
             self.betting_round()
 
         # Showdown if more than one player remains
+        self.stage = Stage.SHOWDOWN
         self.showdown()
         self.reset_round()
 
@@ -328,49 +428,45 @@ class Game:
         """
         if len(self.active_players) > 1:
             winner = self.determine_winner()
-            logger.info(f"The winner is {winner.name} with hand: {winner.show_hand()}")
+            logger.opt(lazy=True).info("The winner is {} with hand: {}", lambda: winner.name, winner.show_hand)
             winner.win_pot(self.pot)
-            logger.info(f"{winner.name} wins the pot of {self.pot} chips.")
+            logger.info("{} wins the pot of {} chips.", winner.name, self.pot)
         elif len(self.active_players) == 1:
             # Only one player remains, they win the pot
-            winner = self.active_players[0]
-            logger.info(f"{winner.name} wins the pot by default.")
+            winner = next(iter(self.active_players))
+            logger.info("{} wins the pot by default.", winner.name)
             winner.win_pot(self.pot)
-            logger.info(f"{winner.name} wins the pot of {self.pot} chips.")
+            logger.info("{} wins the pot of {} chips.", winner.name, self.pot)
         else:
             logger.info("All players have folded. No winner.")
 
-    def determine_winner(self) -> Player:
+    def determine_winner(self) -> Optional[Player]:
         """
         Determines the winner among the remaining players.
         """
-        evaluator = HandEvaluator()
-        best_rank = 0
-        best_hand = None
-        winner = None
-        for player in self.active_players:
-            rank_value, highest_cards = evaluator.evaluate_hand(player.hand, self.community_cards)
-            logger.info(f"{player.name} has a hand rank of {rank_value} with cards {highest_cards}.")
-            if rank_value > best_rank or (rank_value == best_rank and highest_cards > best_hand):
-                best_rank = rank_value
-                best_hand = highest_cards
-                winner = player
-        return winner
+        players = list(self.active_players)
+        if len(players) <= 1:
+            # Nothing to compare; skip the evaluator entirely
+            return players[0] if players else None
+        # Every live player's buffer holds the same board after their two hole cards
+        cards = CARD_INTS[np.stack([player.card_codes for player in players])]
+        scores = HandEvaluator.evaluate_batch(cards[:, :2], cards[0, 2:])
+        for player, score in zip(players, scores.tolist()):
+            logger.info("{} has a hand score of {}.", player.name, score)
+        return players[int(np.argmax(scores))]
 
     def reset_round(self) -> None:
         """
         Resets the game state for the next round.
         """
-        self.community_cards = []
+        self.community_cards.clear()
         self.pot = 0.0
         self.current_bet = 0.0
-        self.game_stage = 'pre-flop'
+        self.stage = Stage.PREFLOP
         self.round_active = False
         self.betting_phase = False
         self.current_player_index = 0
         for player in self.players:
-            player.reset_hand()
-            player.current_bet = 0.0
-            player.folded = False
-            player.all_in = False
+            player.reset()
+        self.set_active_players(self.players)
         logger.info("Round reset. Ready for the next round.")
@@ -1,19 +1,24 @@
 # gui.py
 
+import math
 import pygame
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pygame.locals import *
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from .game import Game
-from .player import Player
+from .player import Player, Stage
 from .ai import AIPlayer
-from .card import Card
+from .card import Card, CARDS
 
 class GUI:
     """
     A class to handle the graphical user interface for the poker game.
     """
 
+    # Rendered strings kept before the text cache is cleared; chip and pot amounts keep changing
+    TEXT_CACHE_SIZE = 512
+
     def __init__(self, game: Game):
         pygame.init()
         self.screen_width = 1024
@@ -37,6 +42,29 @@ class GUI:
         self.raise_input_box = pygame.Rect(650, self.screen_height - 100, 100, 50)
         self.raise_input_text = ''
 
+        # Seat centres around the table, rebuilt only when the number of players changes
+        self._seat_cache_len = -1
+        self._seat_xy: List[Tuple[float, float]] = []
+
+        # Rendered text surfaces keyed on (text, color)
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+
+        # AI decisions run off the render loop; the pending one is polled each frame
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_action: Optional[Future] = None
+
+        # Tick at which the winner message stops being shown, if one is up
+        self._winner_display_until: Optional[int] = None
+
+        # Dirty-rect bookkeeping: screen areas to push this frame, and what each region last showed
+        self._dirty: List[pygame.Rect] = []
+        self._region_state: Dict[object, object] = {}
+        self._needs_full_redraw = True
+
+        # The button strip never changes, so it is drawn once and blitted each frame
+        self._buttons_surface = self.build_buttons_surface()
+        self._buttons_surface_pos = (0, self.button_fold.y)
+
     def load_assets(self):
         """
         Loads images, sounds, and fonts needed for the GUI.
@@ -44,18 +72,24 @@ class GUI:
         # Load table background image
         self.table_image = pygame.image.load('images/table.png').convert()
 
-        # Load card images
-        self.card_images = {}
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
-        for suit in suits:
-            for rank in ranks:
-                card = f'{rank}_of_{suit}'
-                image_path = f'images/cards/{card}.png'
-                self.card_images[card] = pygame.image.load(image_path).convert_alpha()
-
-        # Load card back image
-        self.card_back = pygame.image.load('assets/images/cards/back.png').convert_alpha()
+        # Load card images and pack them, with the card back, into one atlas:
+        # one column per rank, one row per suit and a last row for the back
+        images = [
+            pygame.image.load(f'images/cards/{card.rank}_of_{card.suit}.png').convert_alpha()
+            for card in CARDS
+        ]
+        card_back = pygame.image.load('assets/images/cards/back.png').convert_alpha()
+        card_w = max(image.get_width() for image in images + [card_back])
+        card_h = max(image.get_height() for image in images + [card_back])
+
+        self._atlas = pygame.Surface((len(Card.RANKS) * card_w, (len(Card.SUITS) + 1) * card_h), SRCALPHA)
+        self._card_rects: List[pygame.Rect] = []
+        for card, image in zip(CARDS, images):
+            rect = pygame.Rect((card.rank_int - 2) * card_w, card.suit_int * card_h, *image.get_size())
+            self._atlas.blit(image, rect)
+            self._card_rects.append(rect)
+        self._back_rect = pygame.Rect(0, len(Card.SUITS) * card_h, *card_back.get_size())
+        self._atlas.blit(card_back, self._back_rect)
 
         # Load chip images (if any)
         # self.chip_image = pygame.image.load('assets/images/chips/chip.png').convert_alpha()
@@ -63,51 +97,96 @@ class GUI:
         # Load player avatars (if any)
         # self.avatar_image = pygame.image.load('assets/images/avatars/player.png').convert_alpha()
 
+    def render_text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Renders text with the GUI font, reusing the surface from earlier frames when possible.
+        """
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = self.font.render(text, True, color)
+        return surface
+
     def draw_table(self):
         """
         Draws the poker table background.
         """
         self.screen.blit(self.table_image, (0, 0))
 
-    def draw_players(self):
+    def refresh_region(self, key: object, rect: pygame.Rect, state: object) -> bool:
         """
-        Draws the players, their chips, and their cards.
+        Prepares a screen region for redrawing if what it shows has changed.
+
+        When the region's state differs from the last frame, its background is
+        restored, drawing is clipped to it and it is queued for the display update.
+
+        Returns:
+            bool: True if the region should be drawn this frame.
+        """
+        if self._region_state.get(key) == state:
+            return False
+        self._region_state[key] = state
+        self.screen.set_clip(rect)
+        self.screen.fill((0, 128, 0), rect)
+        self.screen.blit(self.table_image, rect, rect)
+        self._dirty.append(rect)
+        return True
+
+    def seat_positions(self) -> List[Tuple[float, float]]:
+        """
+        Returns the centre of each seat, spaced evenly around the table.
         """
         num_players = len(self.game.players)
-        angle_step = 360 / num_players
-        radius = 250
-        center_x = self.screen_width // 2
-        center_y = self.screen_height // 2
+        if num_players != self._seat_cache_len:
+            radius = 250
+            center_x = self.screen_width // 2
+            center_y = self.screen_height // 2
+            self._seat_xy = []
+            for i in range(num_players):
+                angle = math.radians(360 * i / num_players - 90)  # Start at the top of the circle
+                self._seat_xy.append((center_x + radius * math.cos(angle), center_y + radius * math.sin(angle)))
+            self._seat_cache_len = num_players
+            self._needs_full_redraw = True
+        return self._seat_xy
 
-        for i, player in enumerate(self.game.players):
-            angle = angle_step * i - 90  # Start at the top of the circle
-            x = center_x + radius * pygame.math.cos(pygame.math.radians(angle))
-            y = center_y + radius * pygame.math.sin(pygame.math.radians(angle))
+    def draw_players(self):
+        """
+        Draws the players, their chips, and their cards.
+        """
+        card_h = self._back_rect.height
+        for seat, (player, (x, y)) in enumerate(zip(self.game.players, self.seat_positions())):
+            shows_backs = isinstance(player, AIPlayer) or player.folded
+            state = (player.name, player.chips, player.is_dealer, shows_backs, tuple(card.code for card in player.hand))
+            if not self.refresh_region(('seat', seat), pygame.Rect(x - 100, y - 100, 200, 50 + card_h), state):
+                continue
 
             # Draw player name
-            name_text = self.font.render(player.name, True, (255, 255, 255))
+            name_text = self.render_text(player.name, (255, 255, 255))
             self.screen.blit(name_text, (x - name_text.get_width() // 2, y - 80))
 
             # Draw player chips
-            chips_text = self.font.render(f'Chips: {player.chips}', True, (255, 255, 0))
+            chips_text = self.render_text(f'Chips: {player.chips}', (255, 255, 0))
             self.screen.blit(chips_text, (x - chips_text.get_width() // 2, y - 60))
 
             # Draw player cards
-            if isinstance(player, AIPlayer) or player.folded:
+            if shows_backs:
                 # Show card backs for AI players or if folded
-                self.screen.blit(self.card_back, (x - 36, y - 50))
-                self.screen.blit(self.card_back, (x + 4, y - 50))
+                self.screen.blit(self._atlas, (x - 36, y - 50), self._back_rect)
+                self.screen.blit(self._atlas, (x + 4, y - 50), self._back_rect)
             else:
                 # Show actual cards for the human player
                 if player.hand:
                     for idx, card in enumerate(player.hand):
-                        card_image = self.get_card_image(card)
-                        self.screen.blit(card_image, (x - 36 + idx * 40, y - 50))
+                        atlas, rect = self.get_card_image(card)
+                        self.screen.blit(atlas, (x - 36 + idx * 40, y - 50), rect)
 
             # Indicate if player is the dealer
             if player.is_dealer:
-                dealer_text = self.font.render('D', True, (255, 0, 0))
+                dealer_text = self.render_text('D', (255, 0, 0))
                 self.screen.blit(dealer_text, (x - dealer_text.get_width() // 2, y - 100))
+        self.screen.set_clip(None)
 
     def draw_community_cards(self):
         """
@@ -115,48 +194,72 @@ class GUI:
         """
         center_x = self.screen_width // 2 - 100
         center_y = self.screen_height // 2 - 150
+        region = pygame.Rect(center_x, center_y, 4 * 80 + self._back_rect.width, self._back_rect.height)
+        if not self.refresh_region('community', region, tuple(card.code for card in self.game.community_cards)):
+            return
 
         for idx, card in enumerate(self.game.community_cards):
-            card_image = self.get_card_image(card)
-            self.screen.blit(card_image, (center_x + idx * 80, center_y))
+            atlas, rect = self.get_card_image(card)
+            self.screen.blit(atlas, (center_x + idx * 80, center_y), rect)
+        self.screen.set_clip(None)
 
     def draw_pot(self):
         """
         Displays the current pot amount.
         """
-        pot_text = self.font.render(f'Pot: {self.game.pot}', True, (255, 255, 255))
+        region = pygame.Rect(0, self.screen_height // 2 - 200, self.screen_width, self.font.get_linesize())
+        if not self.refresh_region('pot', region, self.game.pot):
+            return
+        pot_text = self.render_text(f'Pot: {self.game.pot}', (255, 255, 255))
         self.screen.blit(pot_text, (self.screen_width // 2 - pot_text.get_width() // 2, self.screen_height // 2 - 200))
+        self.screen.set_clip(None)
 
-    def draw_buttons(self):
+    def build_buttons_surface(self) -> pygame.Surface:
         """
-        Draws action buttons for the player.
+        Composites the static button strip (buttons, labels and the raise input frame) onto one surface.
         """
+        top = self.button_fold.y
+        surface = pygame.Surface((self.screen_width, self.button_fold.height), SRCALPHA)
+
         # Draw Fold button
-        pygame.draw.rect(self.screen, (200, 0, 0), self.button_fold)
-        fold_text = self.font.render('Fold', True, (255, 255, 255))
-        self.screen.blit(fold_text, (self.button_fold.x + 25, self.button_fold.y + 15))
+        pygame.draw.rect(surface, (200, 0, 0), self.button_fold.move(0, -top))
+        fold_text = self.render_text('Fold', (255, 255, 255))
+        surface.blit(fold_text, (self.button_fold.x + 25, self.button_fold.y - top + 15))
 
         # Draw Check button
-        pygame.draw.rect(self.screen, (0, 200, 0), self.button_check)
-        check_text = self.font.render('Check', True, (255, 255, 255))
-        self.screen.blit(check_text, (self.button_check.x + 20, self.button_check.y + 15))
+        pygame.draw.rect(surface, (0, 200, 0), self.button_check.move(0, -top))
+        check_text = self.render_text('Check', (255, 255, 255))
+        surface.blit(check_text, (self.button_check.x + 20, self.button_check.y - top + 15))
 
         # Draw Call button
-        pygame.draw.rect(self.screen, (0, 0, 200), self.button_call)
-        call_text = self.font.render('Call', True, (255, 255, 255))
-        self.screen.blit(call_text, (self.button_call.x + 25, self.button_call.y + 15))
+        pygame.draw.rect(surface, (0, 0, 200), self.button_call.move(0, -top))
+        call_text = self.render_text('Call', (255, 255, 255))
+        surface.blit(call_text, (self.button_call.x + 25, self.button_call.y - top + 15))
 
         # Draw Raise button
-        pygame.draw.rect(self.screen, (200, 200, 0), self.button_raise)
-        raise_text = self.font.render('Raise', True, (0, 0, 0))
-        self.screen.blit(raise_text, (self.button_raise.x + 25, self.button_raise.y + 15))
+        pygame.draw.rect(surface, (200, 200, 0), self.button_raise.move(0, -top))
+        raise_text = self.render_text('Raise', (0, 0, 0))
+        surface.blit(raise_text, (self.button_raise.x + 25, self.button_raise.y - top + 15))
 
         # Draw input box for raise amount
-        pygame.draw.rect(self.screen, (255, 255, 255), self.raise_input_box, 2)
-        input_text = self.font.render(self.raise_input_text, True, (255, 255, 255))
+        pygame.draw.rect(surface, (255, 255, 255), self.raise_input_box.move(0, -top), 2)
+        return surface
+
+    def draw_buttons(self):
+        """
+        Draws action buttons for the player.
+        """
+        region = self._buttons_surface.get_rect(topleft=self._buttons_surface_pos)
+        if not self.refresh_region('buttons', region, self.raise_input_text):
+            return
+        self.screen.blit(self._buttons_surface, self._buttons_surface_pos)
+
+        # Only the raise amount changes between frames
+        input_text = self.render_text(self.raise_input_text, (255, 255, 255))
         self.screen.blit(input_text, (self.raise_input_box.x + 5, self.raise_input_box.y + 15))
+        self.screen.set_clip(None)
 
-    def get_card_image(self, card: Card):
+    def get_card_image(self, card: Card) -> Tuple[pygame.Surface, pygame.Rect]:
         """
         Retrieves the image for a given card.
 
@@ -164,22 +267,31 @@ class GUI:
             card (Card): The card object.
 
         Returns:
-            Surface: The Pygame surface of the card image.
+            Tuple[Surface, Rect]: The card atlas and the card's source rectangle within it.
         """
-        card_key = f'{card.rank}_of_{card.suit}'
-        return self.card_images.get(card_key, self.card_back)
+        return self._atlas, self._card_rects[card.code]
 
     def update_display(self):
         """
         Updates the game display with the current game state.
         """
-        self.screen.fill((0, 128, 0))  # Green background
-        self.draw_table()
+        self.seat_positions()
+        if self._needs_full_redraw:
+            # Repaint the background and force every region to redraw
+            self.screen.fill((0, 128, 0))  # Green background
+            self.draw_table()
+            self._region_state.clear()
+            self._dirty.append(self.screen.get_rect())
+            self._needs_full_redraw = False
+
+        # Each helper redraws its region only if what it shows has changed
         self.draw_players()
         self.draw_community_cards()
         self.draw_pot()
         self.draw_buttons()
-        pygame.display.flip()
+        if self._dirty:
+            pygame.display.update(self._dirty)
+            self._dirty.clear()
 
     def handle_events(self):
         """
@@ -188,6 +300,7 @@ class GUI:
         for event in pygame.event.get():
             if event.type == QUIT:
                 self.running = False
+                self._ai_executor.shutdown(wait=False, cancel_futures=True)
                 pygame.quit()
                 sys.exit()
             elif event.type == MOUSEBUTTONDOWN:
@@ -215,6 +328,7 @@ class GUI:
                         self.raise_input_text += event.unicode
                 elif event.key == K_ESCAPE:
                     self.running = False
+                    self._ai_executor.shutdown(wait=False, cancel_futures=True)
                     pygame.quit()
                     sys.exit()
 
@@ -227,6 +341,14 @@ class GUI:
             self.update_display()
             self.clock.tick(30)  # Limit to 30 FPS
 
+            if self._winner_display_until is not None:
+                # Keep handling events while the winner is shown
+                if pygame.time.get_ticks() >= self._winner_display_until:
+                    self._winner_display_until = None
+                    self._needs_full_redraw = True  # The message is not part of any region
+                    self.game.reset_round()
+                continue
+
             # Run the game logic
             self.game_loop()
 
@@ -237,22 +359,24 @@ class GUI:
         if not self.game.round_active:
             self.game.start_new_round()
             self.game.round_active = True
-            self.game.betting_phase = 'pre-flop'
+            self.game.betting_phase = True
             self.game.current_player_index = 0
 
         if self.game.betting_phase:
             self.handle_betting()
         else:
-            if len(self.game.community_cards) < 5:
+            if self.game.stage < Stage.RIVER:
                 # Deal the next set of community cards
-                if len(self.game.community_cards) == 0:
+                if self.game.stage == Stage.PREFLOP:
                     self.game.deal_community_cards(3)  # Flop
                 else:
                     self.game.deal_community_cards(1)  # Turn or River
+                self.game.stage = Stage(self.game.stage + 1)
                 self.game.betting_phase = True
                 self.game.current_player_index = 0
             else:
                 # Showdown
+                self.game.stage = Stage.SHOWDOWN
                 winner = self.game.determine_winner()
                 self.display_winner(winner)
                 self.game.round_active = False
@@ -267,8 +391,16 @@ class GUI:
             return
 
         if isinstance(current_player, AIPlayer):
-            action_str = current_player.get_action(self.game.get_game_state())
+            if self._pending_action is None:
+                self._pending_action = self._ai_executor.submit(current_player.get_action, self.game.get_game_state())
+                return
+            if not self._pending_action.done():
+                return  # Keep rendering while the AI thinks
+            action_str = self._pending_action.result()
+            self._pending_action = None
             print(f"{current_player.name} decides to {action_str}")
+            if current_player.folded:
+                self.game.fold_player(current_player)
             self.next_player()
         else:
             # Wait for the human player's action
@@ -282,9 +414,11 @@ class GUI:
             action (str): The action taken ('fold', 'check', 'call', 'raise').
             amount (str, optional): The raise amount if action is 'raise'.
         """
+        if self._pending_action is not None or self._winner_display_until is not None:
+            return  # An AI player is still deciding, or the round is over
         player = self.game.players[self.game.current_player_index]
         if action == 'fold':
-            player.fold()
+            self.game.fold_player(player)
             self.next_player()
         elif action == 'check':
             player.check()
@@ -321,11 +455,9 @@ class GUI:
         Parameters:
             winner (Player): The player who won the round.
         """
-        winner_text = self.font.render(f'{winner.name} wins the pot of {self.game.pot} chips!', True, (255, 255, 255))
+        winner_text = self.render_text(f'{winner.name} wins the pot of {self.game.pot} chips!', (255, 255, 255))
         self.screen.blit(winner_text, (self.screen_width // 2 - winner_text.get_width() // 2, self.screen_height // 2))
         pygame.display.flip()
-        pygame.time.wait(3000)  # Wait for 3 seconds before starting the next round
-
-        # Reset the game state for the next round
-        self.game.reset_round()
+        # Hold the message for 3 seconds; run() resets the round once it expires
+        self._winner_display_until = pygame.time.get_ticks() + 3000
 
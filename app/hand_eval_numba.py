@@ -0,0 +1,206 @@
+"""
+Compiled hand evaluation over integer card codes.
+
+Cards are the packed codes used by ``Card`` (``rank_index << 2 | suit_index``)
+held in ``uint8`` arrays. Results mirror ``HandEvaluator.evaluate_hand``: a
+hand category (1 = high card ... 10 = royal flush) and the tie-breaking ranks
+packed four bits each, most significant first, into a single integer, so two
+hands of the same category compare with one integer comparison.
+"""
+
+import numpy as np
+
+from .jit import njit, prange
+
+
+@njit(cache=True)
+def _popcount(mask):
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def _high_bit(mask):
+    index = -1
+    while mask:
+        mask >>= 1
+        index += 1
+    return index
+
+
+@njit(cache=True)
+def _push(packed, count, rank_index):
+    # Append a rank (2..14) as the next most significant free nibble
+    return packed | ((rank_index + 2) << (4 * (4 - count))), count + 1
+
+
+@njit(cache=True)
+def _push_top(packed, count, mask, k):
+    # Append the k highest ranks present in a 13-bit rank mask
+    for _ in range(k):
+        if mask == 0:
+            break
+        top = _high_bit(mask)
+        packed, count = _push(packed, count, top)
+        mask &= ~(1 << top)
+    return packed, count
+
+
+@njit(cache=True)
+def _straight_high(mask):
+    """
+    Returns the rank index of the highest card of the best straight in a
+    13-bit rank mask, or -1. The wheel (A-2-3-4-5) reports the five.
+    """
+    # Shift so bit 0 is a low ace and bit i + 1 is rank index i
+    m = (mask << 1) | ((mask >> 12) & 1)
+    runs = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    if runs == 0:
+        return -1
+    return _high_bit(runs) + 3
+
+
+@njit(cache=True, nogil=True)
+def evaluate_hand_codes(hole, board):
+    """
+    Evaluates the best five-card hand from hole and board card codes.
+
+    Parameters:
+        hole (np.ndarray): uint8 card codes of the player's hand.
+        board (np.ndarray): uint8 card codes of the community cards.
+
+    Returns:
+        Tuple[int, int]: The hand category and the packed tie-breaking ranks.
+        Fewer than five cards evaluate to (0, 0).
+    """
+    # Rank counts three bits per rank and suit masks 16 bits per suit, packed into
+    # scalars so the kernel allocates nothing per hand
+    counts = 0
+    suit_masks = 0
+    for i in range(hole.shape[0]):
+        counts += np.int64(1) << (3 * (hole[i] >> 2))
+        suit_masks |= np.int64(1) << (16 * (hole[i] & 3) + (hole[i] >> 2))
+    for i in range(board.shape[0]):
+        counts += np.int64(1) << (3 * (board[i] >> 2))
+        suit_masks |= np.int64(1) << (16 * (board[i] & 3) + (board[i] >> 2))
+    if hole.shape[0] + board.shape[0] < 5:
+        return 0, 0
+
+    flush_mask = 0
+    for s in range(4):
+        mask = (suit_masks >> (16 * s)) & 0x1FFF
+        if _popcount(mask) >= 5:
+            flush_mask = mask
+
+    # Straight flush / royal flush
+    if flush_mask:
+        high = _straight_high(flush_mask)
+        if high >= 0:
+            packed, _ = _push(0, 0, high)
+            return (10 if high == 12 else 9), packed
+
+    quads = 0
+    trips = 0
+    pairs = 0
+    rank_mask = 0
+    for r in range(13):
+        c = (counts >> (3 * r)) & 7
+        if c:
+            rank_mask |= 1 << r
+        if c == 4:
+            quads |= 1 << r
+        elif c == 3:
+            trips |= 1 << r
+        elif c == 2:
+            pairs |= 1 << r
+
+    # Four of a kind
+    if quads:
+        top = _high_bit(quads)
+        packed, count = _push(0, 0, top)
+        packed, count = _push_top(packed, count, rank_mask & ~(1 << top), 1)
+        return 8, packed
+
+    # Full house: best trips plus the best other pair (a second trips counts)
+    if trips:
+        top = _high_bit(trips)
+        rest = (trips & ~(1 << top)) | pairs
+        if rest:
+            packed, count = _push(0, 0, top)
+            packed, count = _push(packed, count, _high_bit(rest))
+            return 7, packed
+
+    # Flush
+    if flush_mask:
+        packed, _ = _push_top(0, 0, flush_mask, 5)
+        return 6, packed
+
+    # Straight
+    high = _straight_high(rank_mask)
+    if high >= 0:
+        packed, _ = _push(0, 0, high)
+        return 5, packed
+
+    # Three of a kind
+    if trips:
+        top = _high_bit(trips)
+        packed, count = _push(0, 0, top)
+        packed, count = _push_top(packed, count, rank_mask & ~(1 << top), 2)
+        return 4, packed
+
+    # Two pair
+    if _popcount(pairs) >= 2:
+        packed, count = _push_top(0, 0, pairs, 2)
+        first = _high_bit(pairs)
+        second = _high_bit(pairs & ~(1 << first))
+        packed, count = _push_top(packed, count, rank_mask & ~(1 << first) & ~(1 << second), 1)
+        return 3, packed
+
+    # One pair
+    if pairs:
+        top = _high_bit(pairs)
+        packed, count = _push(0, 0, top)
+        packed, count = _push_top(packed, count, rank_mask & ~(1 << top), 3)
+        return 2, packed
+
+    # High card
+    packed, _ = _push_top(0, 0, rank_mask, 5)
+    return 1, packed
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def evaluate_hand_batch(holes, boards):
+    """
+    Evaluates many hands at once, in parallel when Numba is available.
+
+    Parameters:
+        holes (np.ndarray): (N, 2) uint8 array of hole card codes.
+        boards (np.ndarray): (N, K) uint8 array of board card codes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Hand categories and packed tie-breaking ranks, each of length N.
+    """
+    n = holes.shape[0]
+    ranks = np.empty(n, np.int64)
+    kickers = np.empty(n, np.int64)
+    for i in prange(n):
+        rank, kicker = evaluate_hand_codes(holes[i], boards[i])
+        ranks[i] = rank
+        kickers[i] = kicker
+    return ranks, kickers
+
+
+def unpack_kickers(packed: int) -> list:
+    """
+    Expands packed tie-breaking ranks back into a list of ranks, highest slot first.
+    """
+    ranks = []
+    for shift in range(16, -4, -4):
+        rank = (packed >> shift) & 0xF
+        if rank == 0:
+            break
+        ranks.append(rank)
+    return ranks
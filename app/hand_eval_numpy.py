@@ -0,0 +1,112 @@
+"""
+Vectorized hand evaluation over integer card codes, for when Numba is absent.
+
+Takes the same inputs and gives the same results as
+``hand_eval_numba.evaluate_hand_batch``, but classifies every hand at once
+with array operations on 13-bit rank masks instead of looping per hand, so
+Monte-Carlo equity stays usable without the compiled kernels.
+"""
+
+import numpy as np
+
+# Highest set bit and set-bit count of every 14-bit mask (-1 for an empty mask)
+_MASKS = np.arange(1 << 14)
+_HIGH_BIT = np.full(1 << 14, -1, dtype=np.int64)
+_HIGH_BIT[1:] = np.floor(np.log2(_MASKS[1:])).astype(np.int64)
+_POPCOUNT = np.array([bin(mask).count('1') for mask in range(1 << 14)], dtype=np.int64)
+_RANK_BITS = 1 << np.arange(13, dtype=np.int64)
+
+
+def _bit(rank_index: np.ndarray) -> np.ndarray:
+    # Mask of a rank index, or 0 where there is none
+    return np.where(rank_index >= 0, 1 << np.maximum(rank_index, 0), 0)
+
+
+def _top(mask: np.ndarray, k: int) -> list:
+    # The k highest rank indices present in each mask, -1 once a mask runs out
+    ranks = []
+    for _ in range(k):
+        top = _HIGH_BIT[mask]
+        ranks.append(top)
+        mask = mask & ~_bit(top)
+    return ranks
+
+
+def _pack(ranks: list) -> np.ndarray:
+    # Tie-breaking ranks (2..14) a nibble each, most significant first
+    packed = np.zeros(ranks[0].shape, dtype=np.int64)
+    for i, rank_index in enumerate(ranks):
+        packed |= np.where(rank_index >= 0, (rank_index + 2) << (4 * (4 - i)), 0)
+    return packed
+
+
+def _straight_high(mask: np.ndarray) -> np.ndarray:
+    # Rank index of the best straight's top card, -1 if none; the wheel reports the five
+    m = (mask << 1) | ((mask >> 12) & 1)
+    runs = m & (m >> 1) & (m >> 2) & (m >> 3) & (m >> 4)
+    return np.where(runs > 0, _HIGH_BIT[runs] + 3, -1)
+
+
+def evaluate_hand_batch(holes: np.ndarray, boards: np.ndarray):
+    """
+    Evaluates many hands at once with NumPy array operations.
+
+    Parameters:
+        holes (np.ndarray): (N, 2) uint8 array of hole card codes.
+        boards (np.ndarray): (N, K) uint8 array of board card codes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Hand categories and packed tie-breaking ranks, each of length N.
+    """
+    codes = np.concatenate([holes, boards], axis=1).astype(np.int64)
+    n = codes.shape[0]
+    if codes.shape[1] < 5:
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    ranks = codes >> 2
+    suits = codes & 3
+    bits = 1 << ranks
+
+    counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1)
+    rank_mask = np.bitwise_or.reduce(bits, axis=1)
+    quads = (counts == 4) @ _RANK_BITS
+    trips = (counts == 3) @ _RANK_BITS
+    pairs = (counts == 2) @ _RANK_BITS
+
+    # At most one suit can hold five of seven cards
+    suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+    flush_suit = suit_counts.argmax(axis=1)
+    flush_mask = np.bitwise_or.reduce(np.where(suits == flush_suit[:, None], bits, 0), axis=1)
+    flush_mask = np.where(suit_counts.max(axis=1) >= 5, flush_mask, 0)
+
+    straight_flush = _straight_high(flush_mask)
+    straight = _straight_high(rank_mask)
+    quad = _HIGH_BIT[quads]
+    trip = _HIGH_BIT[trips]
+    full_pair = _HIGH_BIT[(trips & ~_bit(trip)) | pairs]
+    pair, second_pair = _top(pairs, 2)
+
+    conditions = [
+        straight_flush == 12,
+        straight_flush >= 0,
+        quad >= 0,
+        (trip >= 0) & (full_pair >= 0),
+        flush_mask > 0,
+        straight >= 0,
+        trip >= 0,
+        second_pair >= 0,
+        pair >= 0,
+    ]
+    packed = [
+        _pack([straight_flush]),
+        _pack([straight_flush]),
+        _pack([quad] + _top(rank_mask & ~_bit(quad), 1)),
+        _pack([trip, full_pair]),
+        _pack(_top(flush_mask, 5)),
+        _pack([straight]),
+        _pack([trip] + _top(rank_mask & ~_bit(trip), 2)),
+        _pack([pair, second_pair] + _top(rank_mask & ~_bit(pair) & ~_bit(second_pair), 1)),
+        _pack([pair] + _top(rank_mask & ~_bit(pair), 3)),
+    ]
+    categories = np.select(conditions, [10, 9, 8, 7, 6, 5, 4, 3, 2], default=1)
+    kickers = np.select(conditions, packed, default=_pack(_top(rank_mask, 5)))
+    return categories.astype(np.int64), kickers
@@ -1,28 +1,180 @@
-from collections import Counter
-from itertools import combinations
+import math
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
 from .card import Card
+from .jit import NUMBA_AVAILABLE
+from .cactus import (
+    best_int_rank, best_int_rank_batch, PRIMES, STRAIGHT_MASKS, FLUSHES, UNIQUE5, PRODUCTS, PRODUCT_RANKS, RANK_CLASSES, WORST_RANK,
+    FOUR_OF_A_KIND, FULL_HOUSE, FLUSH, STRAIGHT, THREE_OF_A_KIND, TWO_PAIR, ONE_PAIR, HIGH_CARD
+)
+
+# Plain-Python copies of the Cactus Kev tables; the prime product lookup is a dict
+_FLUSHES: List[int] = FLUSHES.tolist()
+_UNIQUE5: List[int] = UNIQUE5.tolist()
+_PRODUCT_RANKS: Dict[int, int] = dict(zip(PRODUCTS.tolist(), PRODUCT_RANKS.tolist()))
+_WHEEL = STRAIGHT_MASKS[-1]
+
+# Chen formula points for the top broadway ranks (lower ranks score half their rank)
+# and the penalty for the gap between the hole cards
+_CHEN_HIGH_CARD = {14: 10, 13: 8, 12: 7, 11: 6}
+_CHEN_GAP_PENALTY = (0, 1, 2, 4, 5)
+
+
+def _hand_of_rank(rank: int) -> Tuple[int, Tuple[int, ...]]:
+    # Translates a Cactus Kev rank into HandEvaluator's (category, tie-breaking ranks)
+    category = 10 - sum(rank >= start for start in (
+        2, FOUR_OF_A_KIND, FULL_HOUSE, FLUSH, STRAIGHT, THREE_OF_A_KIND, TWO_PAIR, ONE_PAIR, HIGH_CARD
+    ))
+    rank_indices = RANK_CLASSES[rank]
+    if category in (5, 9, 10):
+        # Straights are ranked by their top card alone
+        return category, (rank_indices[0] + 2,)
+    return category, tuple(r + 2 for r in dict.fromkeys(rank_indices))
+
+
+_HANDS: Tuple[Tuple[int, Tuple[int, ...]], ...] = ((0, ()),) + tuple(
+    _hand_of_rank(rank) for rank in range(1, WORST_RANK + 1)
+)
+
+
+def _score_of_hand(category: int, kickers: Tuple[int, ...]) -> int:
+    # Category in the high bits, then up to five ranks a nibble each, most significant first
+    score = category << 20
+    for i, rank in enumerate(kickers):
+        score |= rank << (4 * (4 - i))
+    return score
+
+
+# Integer score of each Cactus Kev rank, laid out like hand_eval_numba's results
+_SCORES: Tuple[int, ...] = tuple(_score_of_hand(*hand) for hand in _HANDS)
+
+
+def _eval5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    # Plain-Python counterpart of cactus.eval5
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _FLUSHES[q]
+    return _UNIQUE5[q] or _PRODUCT_RANKS[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def _straight_mask(mask: int) -> int:
+    # Rank mask of the best straight within a 13-bit rank mask, or 0 if there is none
+    run = mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)
+    if run:
+        return 0b11111 << (run.bit_length() - 1)
+    if mask & _WHEEL == _WHEEL:
+        return _WHEEL
+    return 0
+
+
+def _top_five(mask: int) -> int:
+    # Keeps the five highest ranks of a rank mask
+    while mask.bit_count() > 5:
+        mask &= mask - 1
+    return mask
+
+
+def _top_ranks(mask: int, k: int) -> List[int]:
+    # The k highest rank indices in a rank mask, highest first
+    ranks = []
+    for _ in range(k):
+        top = mask.bit_length() - 1
+        ranks.append(top)
+        mask ^= 1 << top
+    return ranks
+
+
+def _evaluate_seven(cards: Tuple[int, ...]) -> int:
+    """
+    Ranks five to seven Cactus Kev cards directly from their per-suit rank masks.
+
+    Plain-Python counterpart of cactus.best_int_rank: rather than trying every
+    five-card subset, the best five cards are read off the masks and looked up once.
+    """
+    suit_masks = [0] * 9  # Indexed by the card's suit bit
+    for card in cards:
+        suit_masks[(card >> 12) & 0xF] |= card >> 16
+    s, h, d, c = suit_masks[1], suit_masks[2], suit_masks[4], suit_masks[8]
+
+    # Seven cards cannot hold a flush alongside quads or a full house
+    for suit_mask in (s, h, d, c):
+        if suit_mask.bit_count() >= 5:
+            return _FLUSHES[_straight_mask(suit_mask) or _top_five(suit_mask)]
+
+    # Ranks held in at least one, two and three suits, and in all four
+    rank_mask = s | h | d | c
+    two = (s & h) | (s & d) | (s & c) | (h & d) | (h & c) | (d & c)
+    three = (s & h & d) | (s & h & c) | (s & d & c) | (h & d & c)
+    quads = s & h & d & c
+    trips = three & ~quads
+    pairs = two & ~three
+
+    if quads:
+        quad = quads.bit_length() - 1
+        kicker = (rank_mask ^ (1 << quad)).bit_length() - 1
+        return _PRODUCT_RANKS[PRIMES[quad] ** 4 * PRIMES[kicker]]
+    if trips:
+        trip = trips.bit_length() - 1
+        others = (trips ^ (1 << trip)) | pairs
+        if others:
+            # A second set of trips plays as the pair
+            return _PRODUCT_RANKS[PRIMES[trip] ** 3 * PRIMES[others.bit_length() - 1] ** 2]
+    straight = _straight_mask(rank_mask)
+    if straight:
+        return _UNIQUE5[straight]
+    if trips:
+        k1, k2 = _top_ranks(rank_mask ^ (1 << trip), 2)
+        return _PRODUCT_RANKS[PRIMES[trip] ** 3 * PRIMES[k1] * PRIMES[k2]]
+    if pairs & (pairs - 1):
+        p1, p2 = _top_ranks(pairs, 2)
+        kicker = (rank_mask ^ (1 << p1) ^ (1 << p2)).bit_length() - 1
+        return _PRODUCT_RANKS[PRIMES[p1] ** 2 * PRIMES[p2] ** 2 * PRIMES[kicker]]
+    if pairs:
+        pair = pairs.bit_length() - 1
+        k1, k2, k3 = _top_ranks(rank_mask ^ (1 << pair), 3)
+        return _PRODUCT_RANKS[PRIMES[pair] ** 2 * PRIMES[k1] * PRIMES[k2] * PRIMES[k3]]
+    return _UNIQUE5[_top_five(rank_mask)]
+
+
+@lru_cache(maxsize=200000)
+def _evaluate(cards: Tuple[int, ...]) -> int:
+    """
+    Ranks Cactus Kev card integers, or 0 for fewer than five cards; memoized,
+    since identical card sets always rank the same.
+    """
+    if len(cards) < 5:
+        return 0
+    if NUMBA_AVAILABLE:
+        return best_int_rank(np.array(cards, dtype=np.int64))
+    return _evaluate_seven(cards)
+
 
 class HandEvaluator:
     """
     A class to evaluate poker hands according to standard poker hand rankings.
     """
     
-    HAND_RANKS: Dict[str, int] = {
-        'High Card': 1,
-        'One Pair': 2,
-        'Two Pair': 3,
-        'Three of a Kind': 4,
-        'Straight': 5,
-        'Flush': 6,
-        'Full House': 7,
-        'Four of a Kind': 8,
-        'Straight Flush': 9,
-        'Royal Flush': 10,
-    }
-    
-    RANK_TO_HAND: Dict[int, str] = {v: k for k, v in HAND_RANKS.items()}
+    HIGH_CARD = 1
+    ONE_PAIR = 2
+    TWO_PAIR = 3
+    THREE_OF_A_KIND = 4
+    STRAIGHT = 5
+    FLUSH = 6
+    FULL_HOUSE = 7
+    FOUR_OF_A_KIND = 8
+    STRAIGHT_FLUSH = 9
+    ROYAL_FLUSH = 10
+
+    # Hand names indexed by category; 0 is left for too few cards
+    RANK_TO_HAND: Tuple[Optional[str], ...] = (
+        None, 'High Card', 'One Pair', 'Two Pair', 'Three of a Kind', 'Straight',
+        'Flush', 'Full House', 'Four of a Kind', 'Straight Flush', 'Royal Flush',
+    )
+
+    HAND_RANKS: Dict[str, int] = {name: category for category, name in enumerate(RANK_TO_HAND) if name}
 
     @staticmethod
     def evaluate_hand(hand: List[Card], community_cards: List[Card]) -> Tuple[int, List[int]]:
@@ -37,182 +189,121 @@ class HandEvaluator:
             Tuple[int, List[int]]: A tuple containing the hand rank value and a list of highest card ranks for tie-breaking.
         """
         
-        # cmbine player hand and community cards
-        all_cards: List[Card] = hand + community_cards
-
-        best_rank: int = 0
-        best_hand: Optional[List[int]] = None
-
-        # iterate over all possible 5-card hands to find the best one
-        for possible_hand in combinations(all_cards, 5):
-            rank, highest_cards = HandEvaluator.evaluate_five_card_hand(possible_hand)
-            # Compare hands based on rank and then highest cards
-            if rank > best_rank or (rank == best_rank and highest_cards > best_hand):
-                best_rank = rank
-                best_hand = highest_cards
-
-        return best_rank, best_hand
+        # Sorted so every ordering of the same cards shares one cache entry
+        cards = tuple(sorted(card.int_repr for card in hand + community_cards))
+        category, kickers = _HANDS[_evaluate(cards)]
+        return category, (list(kickers) if category else None)
 
     @staticmethod
-    def evaluate_five_card_hand(cards: Tuple[Card, ...]) -> Tuple[int, List[int]]:
+    def score_hand(hand: List[Card], community_cards: List[Card]) -> int:
         """
-        Evaluates a single 5-card poker hand.
+        Scores the best poker hand as a single integer.
 
         Parameters:
-            cards (Tuple[Card, ...]): Tuple of 5 Card objects.
+            hand (List[Card]): List of Card objects representing the player's hand.
+            community_cards (List[Card]): List of Card objects on the table.
 
         Returns:
-            Tuple[int, List[int]]: A tuple containing the hand rank value and a list of highest card ranks for tie-breaking.
+            int: ``category << 20`` with the tie-breaking ranks packed a nibble each below it,
+            so higher scores win and equal scores split. 0 for fewer than five cards.
         """
-        
-        # Extract ranks and suits
-        ranks: List[int] = [Card.RANKS[card.rank] for card in cards]
-        suits: List[str] = [card.suit for card in cards]
-        
-        rank_counts: Counter = Counter(ranks)
-        suit_counts: Counter = Counter(suits)
-
-        is_flush: bool = HandEvaluator.is_flush(suit_counts)
-        is_straight, straight_high = HandEvaluator.is_straight(ranks)
-
-        # Check for Straight Flush and Royal Flush
-        if is_flush and is_straight:
-            if straight_high == 14:
-                return (HandEvaluator.HAND_RANKS['Royal Flush'], [14])
-            else:
-                return (HandEvaluator.HAND_RANKS['Straight Flush'], [straight_high])
-
-        # Check for Four of a Kind
-        if 4 in rank_counts.values():
-            four_rank = HandEvaluator.get_rank_by_count(rank_counts, 4)
-            kicker = HandEvaluator.get_high_cards(ranks, exclude=[four_rank])
-            return (HandEvaluator.HAND_RANKS['Four of a Kind'], [four_rank] + kicker)
-
-        # Check for Full House
-        if 3 in rank_counts.values():
-            three_ranks = HandEvaluator.get_ranks_by_count(rank_counts, 3)
-            remaining_ranks = [rank for rank in rank_counts if rank_counts[rank] >= 2 and rank not in three_ranks]
-            if remaining_ranks:
-                # Use the highest three of a kind and the highest pair
-                three_rank = max(three_ranks)
-                pair_rank = max(remaining_ranks)
-                return (HandEvaluator.HAND_RANKS['Full House'], [three_rank, pair_rank])
-
-        # Check for Flush
-        if is_flush:
-            high_cards = sorted(ranks, reverse=True)
-            return (HandEvaluator.HAND_RANKS['Flush'], high_cards)
-
-        # Check for Straight
-        if is_straight:
-            return (HandEvaluator.HAND_RANKS['Straight'], [straight_high])
-
-        # Check for Three of a Kind
-        if 3 in rank_counts.values():
-            three_rank = HandEvaluator.get_rank_by_count(rank_counts, 3)
-            kickers = HandEvaluator.get_high_cards(ranks, exclude=[three_rank], count=2)
-            return (HandEvaluator.HAND_RANKS['Three of a Kind'], [three_rank] + kickers)
-
-        # Check for Two Pair
-        pairs = HandEvaluator.get_ranks_by_count(rank_counts, 2)
-        if len(pairs) >= 2:
-            top_two_pairs = pairs[:2]
-            kicker = HandEvaluator.get_high_cards(ranks, exclude=top_two_pairs, count=1)
-            return (HandEvaluator.HAND_RANKS['Two Pair'], top_two_pairs + kicker)
-
-        # Check for One Pair
-        if 2 in rank_counts.values():
-            pair_rank = HandEvaluator.get_rank_by_count(rank_counts, 2)
-            kickers = HandEvaluator.get_high_cards(ranks, exclude=[pair_rank], count=3)
-            return (HandEvaluator.HAND_RANKS['One Pair'], [pair_rank] + kickers)
-
-        # High Card
-        high_cards = sorted(ranks, reverse=True)[:5]
-        return (HandEvaluator.HAND_RANKS['High Card'], high_cards)
+        return _SCORES[_evaluate(tuple(sorted(card.int_repr for card in hand + community_cards)))]
 
     @staticmethod
-    def is_flush(suit_counts: Counter) -> bool:
+    def evaluate_batch(hands: np.ndarray, community: np.ndarray) -> np.ndarray:
         """
-        Determines if the hand is a flush.
+        Scores many hands against the same community cards in one call.
 
         Parameters:
-            suit_counts (Counter): Counter object of suits.
+            hands (np.ndarray): (N, 2) array of hole cards as Card.int_repr values.
+            community (np.ndarray): The community cards as Card.int_repr values.
 
         Returns:
-            bool: True if flush, else False.
+            np.ndarray: One score per hand, 1 (seven-high) to 7462 (royal flush). Higher
+            scores win and equal scores split, so the kickers need no separate comparison.
         """
-        return any(count >= 5 for count in suit_counts.values())
+        hands = np.asarray(hands, dtype=np.int64)
+        community = np.asarray(community, dtype=np.int64)
+        if hands.shape[1] + community.shape[0] < 5:
+            return np.zeros(hands.shape[0], dtype=np.int64)
+        seats = np.concatenate([hands, np.broadcast_to(community, (hands.shape[0], community.shape[0]))], axis=1)
+        if NUMBA_AVAILABLE:
+            ranks = best_int_rank_batch(seats)
+        else:
+            ranks = np.array([_evaluate_seven(row) for row in seats.tolist()], dtype=np.int64)
+        return WORST_RANK + 1 - ranks
 
     @staticmethod
-    def is_straight(ranks: List[int]) -> Tuple[bool, Optional[int]]:
+    def cheap_preflop_strength(hand: List[Card]) -> float:
         """
-        Determines if the hand is a straight.
+        Approximates the strength of two hole cards with the Chen formula, scaled to [0, 1].
+
+        This is a rough proxy, used only for the bluff bookkeeping of recorded
+        decisions before the flop; it is no substitute for equity.
 
         Parameters:
-            ranks (List[int]): List of integer ranks.
+            hand (List[Card]): The player's two hole cards.
 
         Returns:
-            Tuple[bool, Optional[int]]: (True, high_card) if straight; else (False, None).
+            float: Chen points divided by the 20 of pocket aces, clamped at 0.
         """
-        unique_ranks = set(ranks)
-        sorted_ranks = sorted(unique_ranks)
-        # Handle the special case of Ace acting as 1 in a low straight
-        if 14 in unique_ranks:
-            sorted_ranks_with_low_ace = [1] + sorted_ranks[:-1]
-        else:
-            sorted_ranks_with_low_ace = sorted_ranks
-
-        # Check for straight in both scenarios
-        for ranks_list in [sorted_ranks, sorted_ranks_with_low_ace]:
-            for i in range(len(ranks_list) - 4):
-                window = ranks_list[i:i+5]
-                if window[4] - window[0] == 4 and len(window) == 5:
-                    return True, window[4]
-        return False, None
+        high, low = sorted((card.rank_int for card in hand), reverse=True)
+        points = _CHEN_HIGH_CARD.get(high, high / 2)
+        if high == low:
+            return max(points * 2, 5) / 20
+        if hand[0].suit_int == hand[1].suit_int:
+            points += 2
+        gap = high - low - 1
+        points -= _CHEN_GAP_PENALTY[min(gap, 4)]
+        if gap <= 1 and high < 12:
+            points += 1
+        return max(math.ceil(points), 0) / 20
 
     @staticmethod
-    def get_rank_by_count(rank_counts: Counter, count: int) -> int:
+    def evaluate_five_card_hand(cards: Tuple[Card, ...]) -> Tuple[int, List[int]]:
         """
-        Returns the highest rank that appears a specific number of times.
+        Evaluates a single 5-card poker hand.
 
         Parameters:
-            rank_counts (Counter): Counter object of ranks.
-            count (int): The count to look for.
+            cards (Tuple[Card, ...]): Tuple of 5 Card objects.
 
         Returns:
-            int: Highest rank that appears 'count' times.
+            Tuple[int, List[int]]: A tuple containing the hand rank value and a list of highest card ranks for tie-breaking.
         """
-        ranks = [rank for rank, cnt in rank_counts.items() if cnt == count]
-        return max(ranks) if ranks else None
+        # Unpacked by hand: a generator argument costs as much as the lookup itself
+        c1, c2, c3, c4, c5 = cards
+        category, kickers = _HANDS[_eval5(c1.int_repr, c2.int_repr, c3.int_repr, c4.int_repr, c5.int_repr)]
+        return category, list(kickers)
 
     @staticmethod
-    def get_ranks_by_count(rank_counts: Counter, count: int) -> List[int]:
+    def is_flush(suit_counts: Dict[str, int]) -> bool:
         """
-        Returns all ranks that appear a specific number of times, sorted in descending order.
+        Determines if the hand is a flush.
 
         Parameters:
-            rank_counts (Counter): Counter object of ranks.
-            count (int): The count to look for.
+            suit_counts (Dict[str, int]): Number of cards of each suit, such as a Counter.
 
         Returns:
-            List[int]: Ranks that appear 'count' times, sorted high to low.
+            bool: True if flush, else False.
         """
-        ranks = [rank for rank, cnt in rank_counts.items() if cnt == count]
-        return sorted(ranks, reverse=True)
+        return any(count >= 5 for count in suit_counts.values())
 
     @staticmethod
-    def get_high_cards(ranks: List[int], exclude: List[int] = [], count: int = 1) -> List[int]:
+    def is_straight(ranks: List[int]) -> Tuple[bool, Optional[int]]:
         """
-        Returns the highest cards excluding certain ranks.
+        Determines if the hand is a straight.
 
         Parameters:
             ranks (List[int]): List of integer ranks.
-            exclude (List[int], optional): Ranks to exclude. Defaults to [].
-            count (int, optional): Number of high cards to return. Defaults to 1.
 
         Returns:
-            List[int]: List of high card ranks.
+            Tuple[bool, Optional[int]]: (True, high_card) if straight; else (False, None).
         """
-        high_cards = [rank for rank in ranks if rank not in exclude]
-        high_cards = sorted(high_cards, reverse=True)
-        return high_cards[:count]
+        mask = 0
+        for rank in ranks:
+            mask |= 1 << (rank - 2)
+        straight = _straight_mask(mask)
+        if not straight:
+            return False, None
+        # The wheel's high card is the five; otherwise the mask's top bit is the high card
+        return True, (5 if straight == _WHEEL else straight.bit_length() + 1)
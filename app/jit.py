@@ -0,0 +1,19 @@
+"""
+Optional Numba support.
+
+Numba is an optional extra. When it is installed, ``njit`` and ``prange`` are
+Numba's own; otherwise ``njit`` leaves functions untouched and ``prange`` is
+``range``, so the same kernels still run as ordinary Python.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,9 +1,8 @@
 import sys
 from loguru import logger
 
-def setup_logging():
+def setup_logging(level: str = "INFO", format: str = "{time} {level} {message}"):
     logger.remove()
-    logger.add(sys.stderr, format="{time} {level} {message}")
-    logger.level("INFO")
+    logger.add(sys.stderr, format=format, level=level)
 
-setup_logging()
\ No newline at end of file
+setup_logging()
@@ -1,10 +1,31 @@
 # player.py
 
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
 from .card import Card
 from .data_collector import DataCollector
+from .equity import equity
 from .hand_evaluator import HandEvaluator
 
+# Integer codes for player actions, indexed the same way everywhere
+FOLD, CHECK, CALL, RAISE, ALL_IN = range(5)
+ACTION_CODES: Dict[str, int] = {'fold': FOLD, 'check': CHECK, 'call': CALL, 'raise': RAISE, 'all-in': ALL_IN}
+
+class Stage(IntEnum):
+    """
+    Stages of a hand, in the order they are played.
+    """
+    PREFLOP = 0
+    FLOP = 1
+    TURN = 2
+    RIVER = 3
+    SHOWDOWN = 4
+
+# Display names of each stage, indexed by Stage
+STAGE_NAMES = ('pre-flop', 'flop', 'turn', 'river', 'showdown')
+
 class Player:
     """
     Represents a player in the poker game.
@@ -16,9 +37,12 @@ class Player:
         current_bet (float): The amount the player has bet in the current round.
         folded (bool): Indicates if the player has folded.
         all_in (bool): Indicates if the player is all-in.
+        acted (bool): Indicates if the player has acted since the bet was last raised.
         is_dealer (bool): Indicates if the player is the dealer.
         is_small_blind (bool): Indicates if the player is the small blind.
         is_big_blind (bool): Indicates if the player is the big blind.
+        last_action (Optional[str]): The most recent action taken, if tracked.
+        last_action_code (Optional[int]): The same action as one of the module's action codes.
         data_collector (DataCollector): The data collector instance.
         action_history (List[Dict[str, Any]]): History of player's actions.
         total_aggressive_actions (int): Count of aggressive actions.
@@ -27,6 +51,20 @@ class Player:
         total_possible_bluffs (int): Count of situations where bluffing is possible.
     """
 
+    __slots__ = (
+        'name', 'hand', 'chips', 'current_bet', 'folded', 'all_in', 'acted',
+        'is_dealer', 'is_small_blind', 'is_big_blind', 'last_action', 'last_action_code',
+        'data_collector', 'action_history', 'total_aggressive_actions', 'total_actions',
+        'total_bluffs', 'total_possible_bluffs', '_hs_cache', '_card_codes', '_n_board'
+    )
+
+    # Monte-Carlo run-outs sampled per hand-strength estimate
+    EQUITY_SAMPLES: int = 1000
+
+    # Fixed playing-style values; None means they are measured from the player's actions
+    aggression_factor: Optional[float] = None
+    bluff_probability: Optional[float] = None
+
     def __init__(
         self,
         name: str,
@@ -39,9 +77,17 @@ class Player:
         self.current_bet: float = 0.0
         self.folded: bool = False
         self.all_in: bool = False
+        self.acted: bool = False
         self.is_dealer: bool = False
         self.is_small_blind: bool = False
         self.is_big_blind: bool = False
+        # Hole card codes in slots 0-1 and the board in 2-6, refreshed as cards are dealt
+        self._card_codes: np.ndarray = np.zeros(7, dtype=np.uint8)
+        self._n_board: int = 0
+        # (opponent count, strength) of the last hand-strength estimate on the current cards
+        self._hs_cache: Tuple[Optional[int], float] = (None, 0.0)
+        self.last_action: Optional[str] = None
+        self.last_action_code: Optional[int] = None
 
         self.data_collector = data_collector
 
@@ -55,14 +101,17 @@ class Player:
     def __repr__(self):
         return f"<Player {self.name}>"
 
-    def reset_hand(self) -> None:
+    def reset(self) -> None:
         """
-        Resets the player's hand and betting status for a new round.
+        Resets the player's hand, betting status and positions for a new round.
         """
-        self.hand = []
+        self.hand.clear()
         self.current_bet = 0.0
         self.folded = False
         self.all_in = False
+        self.acted = False
+        self._n_board = 0
+        self._hs_cache = (None, 0.0)
         self.is_dealer = False
         self.is_small_blind = False
         self.is_big_blind = False
@@ -76,7 +125,27 @@ class Player:
         Parameters:
             card (Card): The card to add.
         """
+        self._card_codes[len(self.hand)] = card.code
         self.hand.append(card)
+        self._hs_cache = (None, 0.0)
+
+    @property
+    def card_codes(self) -> np.ndarray:
+        """
+        The player's hole cards followed by the community cards dealt so far, as card codes.
+        """
+        return self._card_codes[:len(self.hand) + self._n_board]
+
+    def on_street_update(self, community_cards: List[Card]) -> None:
+        """
+        Refreshes the player's card buffer after community cards are dealt.
+
+        Parameters:
+            community_cards (List[Card]): All community cards dealt so far.
+        """
+        self._n_board = len(community_cards)
+        self._card_codes[2:2 + self._n_board] = [card.code for card in community_cards]
+        self._hs_cache = (None, 0.0)
 
     def place_bet(self, amount: float) -> None:
         """
@@ -179,28 +248,41 @@ class Player:
         Returns:
             str: 'early', 'middle', or 'late'
         """
-        total_players = len(game_state['active_players'])
-        active_players = game_state['active_players']
-        index = active_players.index(self)
-        if index < total_players / 3:
+        # Rank among the non-folded seats, from the seat bitmask
+        mask = game_state['active_mask']
+        seat = game_state['seat_index'][self]
+        index = (mask & ((1 << seat) - 1)).bit_count()
+        num_active = mask.bit_count()
+        if 3 * index < num_active:
             return 'early'
-        elif index < 2 * total_players / 3:
+        elif 3 * index < 2 * num_active:
             return 'middle'
         else:
             return 'late'
 
-    def evaluate_hand_strength(self, game_state: Dict[str, Any]) -> float:
+    def evaluate_hand_strength(self, game_state: Dict[str, Any], rng: Optional[np.random.Generator] = None) -> float:
         """
-        Evaluates the player's hand strength.
+        Evaluates the player's hand strength as Monte-Carlo equity against the opponents still in the hand.
 
         Parameters:
             game_state (Dict[str, Any]): The current game state.
+            rng (np.random.Generator, optional): Source of randomness for the run-outs.
 
         Returns:
-            float: Normalized hand strength between 0 and 1.
-        """
-        hand_rank_value, _ = HandEvaluator.evaluate_hand(self.hand, game_state['community_cards'])
-        hand_strength = hand_rank_value / 10  # Normalize to 0.1 - 1.0
+            float: Expected share of the pot between 0 and 1.
+        """
+        opponents = (game_state['active_mask'] & ~(1 << game_state['seat_index'][self])).bit_count()
+        # Dealing clears the cache, so between deals the estimate only changes when an opponent folds
+        if opponents == self._hs_cache[0]:
+            return self._hs_cache[1]
+        hand_strength = equity(
+            self._card_codes[:len(self.hand)],
+            self._card_codes[2:2 + self._n_board],
+            num_opponents=opponents,
+            n=self.EQUITY_SAMPLES,
+            rng=rng
+        )
+        self._hs_cache = (opponents, hand_strength)
         return hand_strength
 
     def update_statistics(self, action: str, hand_strength: float) -> None:
@@ -232,7 +314,7 @@ class Player:
         Returns:
             float: The aggression factor (aggressive actions / total actions).
         """
-        if hasattr(self, 'aggression_factor'):
+        if self.aggression_factor is not None:
             return self.aggression_factor
         
         if self.total_actions == 0:
@@ -247,7 +329,7 @@ class Player:
         Returns:
             float: The bluff probability (bluffs / possible bluff situations).
         """
-        if hasattr(self, 'bluff_probability'):
+        if self.bluff_probability is not None:
             return self.bluff_probability
         
         if self.total_possible_bluffs == 0:
@@ -287,8 +369,12 @@ class Player:
         if self.data_collector is None:
             return
 
-        # Evaluate hand strength
-        hand_strength = self.evaluate_hand_strength(game_state)
+        # Before the flop the bluff bookkeeping only needs a rough strength, so the
+        # Chen proxy stands in for a Monte-Carlo estimate
+        if len(game_state['community_cards']) < 3:
+            hand_strength = HandEvaluator.cheap_preflop_strength(self.hand)
+        else:
+            hand_strength = self.evaluate_hand_strength(game_state)
 
         # Update statistics
         self.update_statistics(action, hand_strength)
@@ -301,7 +387,7 @@ class Player:
             'player_name': self.name,
             'hand': [str(card) for card in self.hand],
             'community_cards': [str(card) for card in game_state['community_cards']],
-            'stage': game_state['stage'],
+            'stage': STAGE_NAMES[game_state['stage']],
             'position': self.get_position(game_state),
             'pot': game_state['pot'],
             'current_bet': game_state['current_bet'],
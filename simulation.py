@@ -1,11 +1,17 @@
-from app.logger import logger
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from app.logger import logger, setup_logging
 from app.game import Game
 from app.player import Player
 from app.ai import AIPlayer
 from app.data_collector import DataCollector
 
-def get_game(ai_only: bool = True):
-    data_collector = DataCollector()
+def get_game(ai_only: bool = True, stream_path: Optional[str] = None):
+    data_collector = DataCollector(stream_path=stream_path)
     
     players = [
         AIPlayer(name='Bot1', chips=1000, personality='aggressive', data_collector=data_collector),
@@ -21,39 +27,85 @@ def get_game(ai_only: bool = True):
 
 # game = get_game(ai_only=True)
 
-def main(ai_only: bool = True):
+def play_rounds(num_rounds: int, stream_path: Optional[str] = None) -> DataCollector:
+    """
+    Plays up to num_rounds of AI self-play on a fresh table and returns its collected data.
+    With a stream_path, records are streamed to that file and the collector is closed.
+    """
+    game = get_game(ai_only=True, stream_path=stream_path)
+    for i in range(num_rounds):
+        logger.debug("Starting simulation {}", i + 1)
+        game.play_round()
+        if sum(player.chips > 0 for player in game.players) < 2:
+            break
+    if stream_path is not None:
+        game.data_collector.close()
+    return game.data_collector
+
+def simulate(num_rounds: int = 10000, num_workers: Optional[int] = None, filename: Optional[str] = None) -> DataCollector:
+    """
+    Runs AI self-play across worker processes, one independent table per worker,
+    and concatenates each worker's columnar data into a single collector.
+
+    With a CSV filename, each worker instead streams its rows to its own part file
+    as they are produced, and the parts are appended to filename once all are done,
+    so no process holds the whole dataset. The returned collector is then empty.
+
+    Workers are spawned rather than forked, so each one seeds its own deck and AI
+    generators and sets up its own log sink instead of inheriting the parent's.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    shards = [num_rounds // num_workers + (i < num_rounds % num_workers) for i in range(num_workers)]
+    stem = os.path.splitext(filename)[0] if filename else None
+    parts = [f"{stem}.part{i}.csv" if filename else None for i in range(num_workers)]
+
     data_collector = DataCollector()
+    context = multiprocessing.get_context('spawn')
+    # Workers only report warnings, without timestamps, so per-action records cost a level check
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=context,
+        initializer=setup_logging,
+        initargs=("WARNING", "{level} {message}")
+    ) as pool:
+        for shard in pool.map(play_rounds, shards, parts):
+            data_collector.extend(shard)
 
-    players = [
-        AIPlayer(name='Bot1', chips=1000, personality='aggressive', data_collector=data_collector),
-        AIPlayer(name='Bot2', chips=1000, personality='passive', data_collector=data_collector),
-        AIPlayer(name='Bot3', chips=1000, personality='randomize', data_collector=data_collector),
-        AIPlayer(name='Bot4', chips=1000, personality='randomize', data_collector=data_collector),
-    ]
-    
-    if not ai_only:
-        players.append(Player(name='You', chips=1000, data_collector=data_collector))
-    
-    game = Game(data_collector=data_collector, players=players)
+    if filename:
+        merge_csv_parts(parts, filename)
+    return data_collector
+
+def merge_csv_parts(parts: List[str], filename: str) -> None:
+    """
+    Appends CSV part files into one file, keeping only the first part's header, and removes them.
+    """
+    with open(filename, 'w', newline='') as out:
+        header_written = False
+        for part in parts:
+            if not os.path.exists(part):
+                continue
+            with open(part, newline='') as src:
+                header = src.readline()
+                if not header_written:
+                    out.write(header)
+                    header_written = True
+                shutil.copyfileobj(src, out)
+            os.remove(part)
 
+def main(ai_only: bool = True):
     if ai_only:
-        # Run simulations
+        # Run simulations, split across independent tables in worker processes
+        # Each worker streams its rows to disk as they are produced
         num_simulations = 10000
-        for i in range(num_simulations):
-            logger.info(f"Starting simulation {i+1}")
-            game.play_round()
-            if not game.round_active:
-                logger.info("Game has ended due to insufficient players.")
-                break
+        simulate(num_simulations, filename='poker_game_data.csv')
     else:
-        # Run the game loop
+        # Run the game loop, streaming rows to the dataset as they are produced
+        game = get_game(ai_only=False, stream_path='poker_game_data.csv')
         while True:
             game.play_round()
             if not game.round_active:
                 break
-
-    # Export the dataset
-    data_collector.save_to_csv('poker_game_data.csv')
+        game.data_collector.close()
 
 if __name__ == '__main__':
     main()
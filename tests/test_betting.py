@@ -0,0 +1,193 @@
+import unittest
+from app.ai import AIPlayer
+from app.game import Game
+from app.player import Player, Stage
+
+class ScriptedPlayer(Player):
+    """A player who answers with queued action strings and fails if asked once too often."""
+
+    # Bounds the default answers too, so a round that never ends fails instead of hanging
+    MAX_ASKS = 200
+
+    def __init__(self, name, actions=(), chips=1000, default=None):
+        super().__init__(name, chips)
+        self.actions = list(actions)
+        self.default = default
+        self.asked = 0
+
+    def get_action(self, game_state):
+        self.asked += 1
+        if self.asked > self.MAX_ASKS:
+            raise AssertionError(f"{self.name} was asked to act {self.MAX_ASKS} times")
+        if self.actions:
+            return self.actions.pop(0)
+        if self.default is None:
+            raise AssertionError(f"{self.name} was asked to act after their script ran out")
+        return self.default
+
+
+def new_game(*players):
+    # A hand on the flop with seat 0 dealing, so seat 1 acts first
+    game = Game(players=list(players))
+    game.start_new_round()
+    game.stage = Stage.FLOP
+    return game
+
+
+class TestBettingRound(unittest.TestCase):
+    def assertChips(self, game, total):
+        self.assertEqual(sum(player.chips for player in game.players) + game.pot, total)
+
+    def test_raise_below_current_bet_is_a_call(self):
+        first = ScriptedPlayer('First', ['raise to 40'])
+        second = ScriptedPlayer('Second', ['raise to 20'])
+        third = ScriptedPlayer('Third', ['raise to 40'])
+        game = new_game(third, first, second)
+        game.betting_round()
+        self.assertEqual([p.current_bet for p in game.players], [40.0, 40.0, 40.0])
+        self.assertEqual(second.chips, 960)
+        self.assertChips(game, 3000)
+
+    def test_raise_to_own_bet_takes_no_chips_back(self):
+        first = ScriptedPlayer('First', ['raise to 40', 'raise to 10'])
+        second = ScriptedPlayer('Second', ['raise to 80'])
+        game = new_game(second, first)
+        game.betting_round()
+        self.assertEqual(first.current_bet, 80.0)
+        self.assertEqual(first.chips, 920)
+        self.assertEqual(game.pot, 160.0)
+        self.assertChips(game, 2000)
+
+    def test_check_around(self):
+        players = [ScriptedPlayer(name, ['check']) for name in ('Third', 'First', 'Second')]
+        game = new_game(*players)
+        game.betting_round()
+        self.assertTrue(all(not p.actions for p in players))
+        self.assertEqual(game.current_bet, 0.0)
+        self.assertChips(game, 3000)
+
+    def test_raise_reopens_action(self):
+        first = ScriptedPlayer('First', ['check', 'call'])
+        second = ScriptedPlayer('Second', ['raise to 50'])
+        third = ScriptedPlayer('Third', ['call'])
+        game = new_game(third, first, second)
+        game.betting_round()
+        self.assertEqual(first.actions, [])
+        self.assertEqual([p.current_bet for p in game.players], [50.0, 50.0, 50.0])
+        self.assertChips(game, 3000)
+
+    def test_short_all_in_does_not_reopen_action(self):
+        first = ScriptedPlayer('First', ['raise to 50'])
+        second = ScriptedPlayer('Second', ['all-in'], chips=30)
+        third = ScriptedPlayer('Third', ['call'])
+        game = new_game(third, first, second)
+        game.betting_round()
+        self.assertTrue(second.all_in)
+        self.assertEqual(game.current_bet, 50.0)
+        self.assertEqual(third.current_bet, 50.0)
+        self.assertChips(game, 2030)
+
+    def test_shove_from_last_seat_is_answered(self):
+        first = ScriptedPlayer('First', ['check', 'call'])
+        last = ScriptedPlayer('Last', ['all-in'])
+        game = new_game(last, first)
+        game.betting_round()
+        self.assertEqual(first.actions, [])
+        self.assertEqual([p.current_bet for p in game.players], [1000.0, 1000.0])
+        self.assertChips(game, 2000)
+
+    def test_players_sharing_a_name_keep_their_seats(self):
+        first = ScriptedPlayer('Bot', ['fold'])
+        second = ScriptedPlayer('Bot', ['check'])
+        dealer = ScriptedPlayer('Dealer', ['check'])
+        game = new_game(dealer, first, second)
+        self.assertEqual(game.active_mask, 0b111)
+        self.assertEqual(second.get_position(game.get_game_state()), 'late')
+        game.betting_round()
+        self.assertEqual(game.active_mask, 0b101)
+        self.assertEqual(list(game.active_players), [dealer, second])
+
+    def test_fold_to_one_player(self):
+        first = ScriptedPlayer('First', ['raise to 50'])
+        second = ScriptedPlayer('Second', ['fold'])
+        third = ScriptedPlayer('Third', ['fold'])
+        game = new_game(third, first, second)
+        game.betting_round()
+        self.assertEqual(list(game.active_players), [first])
+        self.assertChips(game, 3000)
+
+    def test_reset_round_restores_every_seat(self):
+        first = ScriptedPlayer('First', ['fold'])
+        second = ScriptedPlayer('Second', ['check'])
+        dealer = ScriptedPlayer('Dealer', ['check'])
+        game = new_game(dealer, first, second)
+        game.betting_round()
+        game.reset_round()
+        self.assertEqual(list(game.active_players), game.players)
+        self.assertEqual(game.active_mask, 0b111)
+
+
+class TestUnmatchedCount(unittest.TestCase):
+    def play(self, *players):
+        game = new_game(*players)
+        game.betting_round()
+        self.assertTrue(all(not p.actions for p in players))
+        self.assertEqual(game._unmatched_count, 0)
+        return game
+
+    def test_raise_after_checks_resets_count(self):
+        first = ScriptedPlayer('First', ['check', 'call'])
+        second = ScriptedPlayer('Second', ['check', 'fold'])
+        third = ScriptedPlayer('Third', ['raise to 60'])
+        fourth = ScriptedPlayer('Fourth', ['call'])
+        game = self.play(fourth, first, second, third)
+        self.assertEqual(list(game.active_players), [fourth, first, third])
+
+    def test_reraise_resets_count_again(self):
+        first = ScriptedPlayer('First', ['raise to 50', 'call'])
+        second = ScriptedPlayer('Second', ['raise to 100'])
+        third = ScriptedPlayer('Third', ['call'])
+        game = self.play(third, first, second)
+        self.assertEqual(game.pot, 300.0)
+
+    def test_short_all_in_call_is_matched(self):
+        first = ScriptedPlayer('First', ['raise to 50'])
+        second = ScriptedPlayer('Second', ['call'], chips=20)
+        third = ScriptedPlayer('Third', ['call'])
+        game = self.play(third, first, second)
+        self.assertTrue(second.all_in)
+        self.assertEqual(game.pot, 120.0)
+
+    def test_fold_while_unmatched(self):
+        first = ScriptedPlayer('First', ['raise to 50'])
+        second = ScriptedPlayer('Second', ['fold'])
+        third = ScriptedPlayer('Third', ['call'])
+        game = self.play(third, first, second)
+        self.assertEqual(list(game.active_players), [third, first])
+
+
+class TestPlayRound(unittest.TestCase):
+    def assertRoundsConserveChips(self, players, rounds):
+        total = sum(player.chips for player in players)
+        game = Game(players=list(players))
+        for _ in range(rounds):
+            game.play_round()
+            # AI bet sizes are fractional, so the sum is exact only to float precision
+            self.assertAlmostEqual(sum(player.chips for player in players), total, places=6)
+
+    def test_scripted_rounds_conserve_chips(self):
+        self.assertRoundsConserveChips([
+            ScriptedPlayer('Raiser', default='raise to 100'),
+            ScriptedPlayer('Caller', default='call'),
+            ScriptedPlayer('Folder', ['call', 'check', 'fold'], default='call', chips=300),
+        ], rounds=5)
+
+    def test_ai_rounds_conserve_chips(self):
+        self.assertRoundsConserveChips([
+            AIPlayer(name='Bot1', personality='aggressive'),
+            AIPlayer(name='Bot2', personality='passive'),
+            AIPlayer(name='Bot3', personality='tight'),
+        ], rounds=10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from app.card import Card
+
+class TestCard(unittest.TestCase):
+    def test_code_round_trip(self):
+        for code in range(52):
+            card = Card.from_code(code)
+            self.assertEqual(Card(card.suit, card.rank).code, code)
+
+    def test_rank_and_suit(self):
+        card = Card('Spades', 'Ace')
+        self.assertEqual(card.rank, 'Ace')
+        self.assertEqual(card.suit, 'Spades')
+        self.assertEqual(card.rank_int, 14)
+        self.assertEqual(card.suit_int, Card.SUITS.index('Spades'))
+        self.assertEqual(repr(card), 'Ace of Spades')
+
+    def test_int_repr(self):
+        # Cactus Kev layout: rank bit, suit bit, rank index and rank prime
+        card = Card('Diamonds', 'King')
+        self.assertEqual(card.int_repr, (1 << 27) | (0x2000) | (11 << 8) | 37)
+        self.assertEqual(Card.from_code(card.code).int_repr, card.int_repr)
+
+    def test_immutable_and_hashable(self):
+        card = Card('Hearts', '10')
+        self.assertEqual(card, Card.from_code(card.code))
+        self.assertEqual(hash(card), card.int_repr)
+        with self.assertRaises(AttributeError):
+            card.code = 0
+
+if __name__ == '__main__':
+    unittest.main()
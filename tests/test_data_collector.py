@@ -0,0 +1,92 @@
+import importlib.util
+import math
+import os
+import tempfile
+import unittest
+import pandas as pd
+from app.data_collector import DataCollector
+
+class TestDataCollector(unittest.TestCase):
+    def test_records_become_columns(self):
+        collector = DataCollector()
+        collector.record_decision_point({'player_name': 'Bot1', 'pot': 15.0, 'action': 'call'})
+        collector.record_decision_point({'player_name': 'Bot2', 'pot': 30.0, 'action': 'fold'})
+        df = collector.get_dataset()
+        self.assertEqual(list(df.columns), ['player_name', 'pot', 'action'])
+        self.assertEqual(list(df['pot']), [15.0, 30.0])
+        self.assertEqual(collector.get_stats()['num_records'], 2)
+
+    def test_missing_and_mixed_fields(self):
+        collector = DataCollector()
+        collector.record_decision_point({'pot': 15.0})
+        collector.record_decision_point({'pot': None, 'amount': 5.0})
+        df = collector.get_dataset()
+        self.assertEqual(len(df), 2)
+        self.assertTrue(math.isnan(df['amount'][0]))
+        self.assertTrue(math.isnan(df['pot'][1]))
+
+    def test_extend(self):
+        first, second = DataCollector(), DataCollector()
+        first.record_decision_point({'player_name': 'Bot1', 'pot': 15.0})
+        second.record_decision_point({'player_name': 'Bot2', 'amount': 5.0})
+        second.record_decision_point({'player_name': 'Bot3', 'amount': 10.0})
+        first.extend(second)
+        df = first.get_dataset()
+        self.assertEqual(list(df['player_name']), ['Bot1', 'Bot2', 'Bot3'])
+        self.assertEqual(list(df['amount'][1:]), [5.0, 10.0])
+        self.assertTrue(math.isnan(df['pot'][2]))
+
+    def test_reset(self):
+        collector = DataCollector()
+        collector.record_decision_point({'pot': 15.0})
+        collector.reset()
+        self.assertEqual(collector.get_stats(), {'num_records': 0, 'fields': []})
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow not installed')
+    def test_stream_to_arrow(self):
+        import pyarrow as pa
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.arrow')
+            collector = DataCollector(stream_path=path, batch_size=2)
+            for i in range(5):
+                collector.record_decision_point({'player_name': f'Bot{i}', 'pot': float(i)})
+            self.assertEqual(collector.get_stats()['num_records'], 5)
+            self.assertEqual(len(collector.get_dataset()), 1)
+            collector.close()
+            with pa.ipc.open_file(path) as reader:
+                table = reader.read_all()
+            self.assertEqual(table.column('pot').to_pylist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_stream_to_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.csv')
+            collector = DataCollector(stream_path=path, batch_size=2)
+            for i in range(5):
+                collector.record_decision_point({'player_name': f'Bot{i}', 'pot': float(i)})
+            self.assertEqual(len(collector.get_dataset()), 1)
+            collector.save_to_csv(path)
+            df = pd.read_csv(path)
+            self.assertEqual(list(df.columns), ['player_name', 'pot'])
+            self.assertEqual(list(df['pot']), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_stream_to_csv_matches_pandas(self):
+        records = [
+            {'player_name': 'Bot1', 'hand': ['Ah', 'Kd'], 'pot': 15.0, 'amount': 5.0, 'chips': 1000, 'folded': False},
+            {'player_name': 'Bot2', 'hand': ['2c', '7d'], 'pot': None, 'chips': 990, 'folded': True},
+            {'player_name': 'Bot3', 'hand': [], 'pot': float('nan'), 'amount': 2.5, 'chips': 980, 'folded': False},
+            {'player_name': None, 'hand': ['Qs', 'Qh'], 'pot': 30.0, 'chips': 970, 'folded': False, 'late': 1.0},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.csv')
+            collector = DataCollector(stream_path=path, batch_size=2)
+            for record in records:
+                collector.record_decision_point(record)
+            collector.close()
+            with open(path, newline='') as streamed:
+                actual = streamed.read()
+        # The late field arrives after the header is written, so it is left out
+        expected = pd.DataFrame(records).drop(columns='late').to_csv(index=False)
+        self.assertEqual(actual, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from app.deck import Deck
 
 class TestDeck(unittest.TestCase):
@@ -6,5 +7,36 @@ class TestDeck(unittest.TestCase):
         deck = Deck()
         self.assertEqual(len(deck.cards), 52)
 
+    def test_cut_rotates_cards(self):
+        deck = Deck()
+        deck.cut()
+        start = int(deck.cards[0])
+        self.assertEqual(list(deck.cards), [(start + i) % 52 for i in range(52)])
+
+    def test_cut_keeps_dealt_cards(self):
+        deck = Deck()
+        dealt = [deck.deal() for _ in range(5)]
+        deck.cut()
+        self.assertEqual([card.code for card in dealt], list(range(5)))
+        self.assertEqual(sorted(deck.cards[5:]), list(range(5, 52)))
+
+    def test_reset_returns_all_cards(self):
+        deck = Deck()
+        deck.shuffle()
+        dealt = deck.deal_many(7)
+        self.assertEqual([card.code for card in dealt], list(deck.cards[:7]))
+        deck.reset()
+        self.assertEqual(len(deck), 52)
+        self.assertEqual(sorted(deck.cards), list(range(52)))
+
+    def test_deal_exhausts_deck(self):
+        deck = Deck()
+        deck.shuffle()
+        codes = {deck.deal().code for _ in range(52)}
+        self.assertEqual(codes, set(range(52)))
+        self.assertEqual(len(deck), 0)
+        with self.assertRaises(IndexError):
+            deck.deal()
+
 if __name__ == '__main__':
     unittest.main()
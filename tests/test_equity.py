@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+from app.card import Card
+from app.equity import equity
+
+def code(suit, rank):
+    return Card(suit, rank).code
+
+class TestEquity(unittest.TestCase):
+    def test_made_royal_flush_always_wins(self):
+        hole = [code('Spades', 'Ace'), code('Spades', 'King')]
+        board = [code('Spades', 'Queen'), code('Spades', 'Jack'), code('Spades', '10')]
+        self.assertEqual(equity(hole, board, num_opponents=3, n=200), 1.0)
+
+    def test_pocket_aces_heads_up(self):
+        hole = [code('Spades', 'Ace'), code('Hearts', 'Ace')]
+        result = equity(hole, num_opponents=1, n=4000, rng=np.random.default_rng(0))
+        self.assertAlmostEqual(result, 0.85, delta=0.03)
+
+    def test_board_plays_splits_pot(self):
+        # The board plays for everyone: a royal flush on the table
+        board = [code('Hearts', rank) for rank in ('10', 'Jack', 'Queen', 'King', 'Ace')]
+        hole = [code('Clubs', '2'), code('Diamonds', '3')]
+        self.assertAlmostEqual(equity(hole, board, num_opponents=2, n=100), 1 / 3)
+
+if __name__ == '__main__':
+    unittest.main()
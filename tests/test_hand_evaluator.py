@@ -0,0 +1,135 @@
+import unittest
+import numpy as np
+from app.card import Card
+from app.hand_evaluator import HandEvaluator, _evaluate_seven
+from app.cactus import CARD_INTS, best_int_rank, best_int_rank_batch
+from app.hand_eval_numba import evaluate_hand_codes, evaluate_hand_batch, unpack_kickers
+from app import hand_eval_numpy
+
+SUITS = {'h': 'Hearts', 'd': 'Diamonds', 'c': 'Clubs', 's': 'Spades'}
+RANKS = {'T': '10', 'J': 'Jack', 'Q': 'Queen', 'K': 'King', 'A': 'Ace'}
+
+def cards(text):
+    return [Card(SUITS[token[-1]], RANKS.get(token[:-1], token[:-1])) for token in text.split()]
+
+# (hole, board, expected category, expected tie-breaking ranks)
+HANDS = [
+    ('Ah Kh', 'Qh Jh Th 2c 3d', 10, [14]),
+    ('5s 4s', '3s 2s As Kd Kc', 9, [5]),
+    ('9c 9d', '9h 9s Kc 2d 3h', 8, [9, 13]),
+    ('7c 7d', '7h Kc Kd Ks 2h', 7, [13, 7]),
+    ('Ac 3c', '9c 7c 5c Kd Kh', 6, [14, 9, 7, 5, 3]),
+    ('Ad 2c', '3h 4s 5d Kc Kh', 5, [5]),
+    ('Qd Jc', 'Th 9s 8d 8c 2h', 5, [12]),
+    ('6d 6c', '6h As Kd 2c 3h', 4, [6, 14, 13]),
+    ('Jd Jc', '4h 4s Kd 2c 2h', 3, [11, 4, 13]),
+    ('Ad Jc', 'Ah 9s 7d 4c 2h', 2, [14, 11, 9, 7]),
+    ('Ad Jc', 'Qh 9s 7d 4c 2h', 1, [14, 12, 11, 9, 7]),
+]
+
+class TestHandEvaluator(unittest.TestCase):
+    def test_known_hands(self):
+        for hole, board, category, kickers in HANDS:
+            with self.subTest(hole=hole, board=board):
+                self.assertEqual(HandEvaluator.evaluate_hand(cards(hole), cards(board)), (category, kickers))
+
+    def test_batch_scores_break_ties(self):
+        board = [card.int_repr for card in cards('Qh 9s 7d 4c 2h')]
+        hands = [[card.int_repr for card in cards(hole)] for hole in ('Ad Jc', 'Ac Jd', 'Ad Tc', '2d 2c')]
+        scores = HandEvaluator.evaluate_batch(hands, board)
+        self.assertEqual(scores[0], scores[1])
+        self.assertGreater(scores[0], scores[2])
+        self.assertEqual(int(np.argmax(scores)), 3)
+
+    def test_score_hand(self):
+        for hole, board, category, kickers in HANDS:
+            with self.subTest(hole=hole, board=board):
+                score = HandEvaluator.score_hand(cards(hole), cards(board))
+                rank, packed = evaluate_hand_codes(TestCompiledEvaluator.codes(hole), TestCompiledEvaluator.codes(board))
+                self.assertEqual(score, (rank << 20) | packed)
+                self.assertEqual(score >> 20, category)
+
+    def test_five_card_hand(self):
+        for _, board, _, _ in HANDS:
+            with self.subTest(board=board):
+                five = tuple(cards(board))
+                self.assertEqual(HandEvaluator.evaluate_five_card_hand(five), HandEvaluator.evaluate_hand([], list(five)))
+
+    def test_is_straight(self):
+        self.assertEqual(HandEvaluator.is_straight([14, 13, 12, 11, 10]), (True, 14))
+        self.assertEqual(HandEvaluator.is_straight([14, 2, 3, 4, 5]), (True, 5))
+        self.assertEqual(HandEvaluator.is_straight([2, 3, 4, 5, 6, 7, 8]), (True, 8))
+        self.assertEqual(HandEvaluator.is_straight([13, 14, 2, 3, 4]), (False, None))
+
+    def test_cheap_preflop_strength(self):
+        self.assertEqual(HandEvaluator.cheap_preflop_strength(cards('Ah Ad')), 1.0)
+        self.assertEqual(HandEvaluator.cheap_preflop_strength(cards('2h 2d')), 0.25)
+        self.assertEqual(HandEvaluator.cheap_preflop_strength(cards('Ks Qs')), 0.5)
+        self.assertEqual(HandEvaluator.cheap_preflop_strength(cards('7d 2c')), 0.0)
+
+    def test_too_few_cards(self):
+        self.assertEqual(HandEvaluator.evaluate_hand(cards('Ad Ac'), []), (0, None))
+
+
+class TestCompiledEvaluator(unittest.TestCase):
+    @staticmethod
+    def codes(text):
+        return np.array([card.code for card in cards(text)], dtype=np.uint8)
+
+    def test_matches_hand_evaluator(self):
+        for hole, board, category, kickers in HANDS:
+            with self.subTest(hole=hole, board=board):
+                rank, packed = evaluate_hand_codes(self.codes(hole), self.codes(board))
+                self.assertEqual((rank, unpack_kickers(packed)), (category, kickers))
+
+    def test_batch(self):
+        holes = np.stack([self.codes(hole) for hole, _, _, _ in HANDS])
+        boards = np.stack([self.codes(board) for _, board, _, _ in HANDS])
+        ranks, _ = evaluate_hand_batch(holes, boards)
+        self.assertEqual(list(ranks), [category for _, _, category, _ in HANDS])
+
+    def test_numpy_batch_matches_compiled(self):
+        holes = np.stack([self.codes(hole) for hole, _, _, _ in HANDS])
+        boards = np.stack([self.codes(board) for _, board, _, _ in HANDS])
+        rng = np.random.default_rng(0)
+        dealt = np.argsort(rng.random((5000, 52)), axis=1)[:, :7].astype(np.uint8)
+        holes = np.concatenate([holes, dealt[:, :2]])
+        for size in (3, 4, 5):
+            with self.subTest(board_size=size):
+                boards_k = np.concatenate([boards[:, :size], dealt[:, 2:2 + size]])
+                expected = evaluate_hand_batch(holes, boards_k)
+                actual = hand_eval_numpy.evaluate_hand_batch(holes, boards_k)
+                np.testing.assert_array_equal(actual[0], expected[0])
+                np.testing.assert_array_equal(actual[1], expected[1])
+
+
+class TestCactusKev(unittest.TestCase):
+    @staticmethod
+    def ints(hole, board):
+        codes = np.array([card.code for card in cards(hole) + cards(board)], dtype=np.uint8)
+        return CARD_INTS[codes].astype(np.int64)
+
+    def test_royal_flush_is_strongest(self):
+        self.assertEqual(best_int_rank(self.ints(*HANDS[0][:2])), 1)
+
+    def test_ordering_matches_hand_evaluator(self):
+        # Cactus Kev ranks count down: 1 is the best hand
+        for hole_a, board_a, category_a, kickers_a in HANDS:
+            for hole_b, board_b, category_b, kickers_b in HANDS:
+                expected = (category_a, kickers_a) > (category_b, kickers_b)
+                actual = best_int_rank(self.ints(hole_a, board_a)) < best_int_rank(self.ints(hole_b, board_b))
+                self.assertEqual(actual, expected, (hole_a, board_a, hole_b, board_b))
+
+    def test_direct_seven_card_matches_subsets(self):
+        for hole, board, _, _ in HANDS:
+            with self.subTest(hole=hole, board=board):
+                ints = tuple(card.int_repr for card in cards(hole) + cards(board))
+                self.assertEqual(_evaluate_seven(ints), best_int_rank(np.array(ints, dtype=np.int64)))
+
+    def test_int_batch_matches_single_hands(self):
+        hands = np.array([[card.int_repr for card in cards(hole) + cards(board)] for hole, board, _, _ in HANDS])
+        expected = [best_int_rank(self.ints(hole, board)) for hole, board, _, _ in HANDS]
+        self.assertEqual(list(best_int_rank_batch(hands)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
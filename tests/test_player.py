@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+import numpy as np
+from app import player as player_module
+from app.card import Card
+from app.game import Game
+from app.player import Player
+
+def cards(*names):
+    return [Card(suit, rank) for rank, suit in names]
+
+class TestHandStrengthCache(unittest.TestCase):
+    def setUp(self):
+        self.player = Player('Hero')
+        self.state = {'active_mask': 0b11, 'seat_index': {self.player: 0}}
+        self.rng = np.random.default_rng(0)
+        patcher = mock.patch.object(player_module, 'equity', wraps=player_module.equity)
+        self.equity = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def strength(self):
+        return self.player.evaluate_hand_strength(self.state, self.rng)
+
+    def test_new_street_and_hand_recompute(self):
+        for card in cards(('Ace', 'Spades'), ('Ace', 'Hearts')):
+            self.player.receive_card(card)
+        preflop = self.strength()
+        self.assertEqual(self.strength(), preflop)
+        self.assertEqual(self.equity.call_count, 1)
+
+        # Quad aces on the flop all but lock up the pot
+        self.player.on_street_update(cards(('Ace', 'Diamonds'), ('Ace', 'Clubs'), ('2', 'Hearts')))
+        self.assertGreater(self.strength(), 0.99)
+        self.assertEqual(self.equity.call_count, 2)
+
+        self.player.reset()
+        for card in cards(('7', 'Clubs'), ('2', 'Diamonds')):
+            self.player.receive_card(card)
+        self.assertLess(self.strength(), preflop)
+        self.assertEqual(self.equity.call_count, 3)
+
+    def test_opponent_fold_recomputes(self):
+        self.state = {'active_mask': 0b111, 'seat_index': {self.player: 0}}
+        for card in cards(('King', 'Spades'), ('King', 'Hearts')):
+            self.player.receive_card(card)
+        self.strength()
+        self.state['active_mask'] = 0b011
+        self.strength()
+        self.assertEqual(self.equity.call_count, 2)
+
+
+class TestCardCodes(unittest.TestCase):
+    def assertCodes(self, player, community_cards):
+        expected = [card.code for card in player.hand + community_cards]
+        self.assertEqual(player.card_codes.tolist(), expected)
+
+    def test_buffer_follows_the_deal(self):
+        game = Game(players=[Player('A'), Player('B'), Player('C')])
+        game.start_new_round()
+        for player in game.players:
+            self.assertCodes(player, [])
+        for number in (3, 1, 1):
+            game.deal_community_cards(number)
+            for player in game.players:
+                with self.subTest(board=len(game.community_cards), player=player.name):
+                    self.assertCodes(player, game.community_cards)
+
+        game.reset_round()
+        for player in game.players:
+            self.assertEqual(player.card_codes.tolist(), [])
+        game.start_new_round()
+        game.deal_community_cards(3)
+        for player in game.players:
+            self.assertCodes(player, game.community_cards)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from simulation import simulate
+
+class TestSimulate(unittest.TestCase):
+    def test_workers_stream_into_one_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.csv')
+            collector = simulate(6, num_workers=2, filename=path)
+            self.assertEqual(os.listdir(tmp), ['data.csv'])
+            self.assertEqual(collector.get_stats()['num_records'], 0)
+            with open(path) as merged:
+                header = merged.readline()
+                rows = merged.read().splitlines()
+            self.assertTrue(header.startswith('player_name,'))
+            self.assertGreater(len(rows), 0)
+            self.assertNotIn(header.rstrip('\n'), rows)
+            self.assertEqual(len(pd.read_csv(path)), len(rows))
+
+    def test_workers_return_records_in_memory(self):
+        collector = simulate(4, num_workers=2)
+        stats = collector.get_stats()
+        self.assertGreater(stats['num_records'], 0)
+        self.assertIn('player_name', stats['fields'])
+
+if __name__ == '__main__':
+    unittest.main()